@@ -1,19 +1,318 @@
 import streamlit as st
-import plotly.express as px
 import calendar
 import pandas as pd
-import statsmodels.api as sm
 import io
 import os
-import plotly.io as pio
 import json
-import pathlib
+from src.forecasting import forecaster_for, period_start
+from src.rollup import rollup_for
+
+
+month_order = list(calendar.month_name)[1:]  # ['January', 'February', ..., 'December']
+
+# Every sidebar filter narrows the same booking_filtered frame, so all data sections
+# depend on all of them; sections listed with fewer inputs only rerun for those.
+FILTER_INPUTS = ('year', 'month', 'destination', 'age', 'airline')
+
+SECTION_DEPENDENCIES = {
+    'kpis': FILTER_INPUTS,
+    'age': FILTER_INPUTS,
+    'destinations': FILTER_INPUTS,
+    'monthly': FILTER_INPUTS,
+    # The forecast projects whole series forward, so only the series filters apply
+    'forecast': ('destination', 'age', 'airline'),
+    'airlines': FILTER_INPUTS,
+    'preferences': FILTER_INPUTS,
+    'download': ('format',),
+}
+
+
+# -----------------------------
+# Section reruns
+# -----------------------------
+def _freeze(value):
+    # Multiselect values are lists; make them comparable/hashable
+    return tuple(value) if isinstance(value, (list, tuple)) else value
+
+def run_section(name, inputs, generation, compute):
+    """
+    Return the computed content of a dashboard section, recomputing it only when
+    the inputs it depends on (see SECTION_DEPENDENCIES) or the dataset generation changed.
+
+    Every recompute is counted in st.session_state['section_runs'][name].
+    """
+    key = (generation,) + tuple(_freeze(inputs.get(i)) for i in SECTION_DEPENDENCIES[name])
+    cache = st.session_state.setdefault('section_cache', {})
+    runs = st.session_state.setdefault('section_runs', {})
+
+    cached = cache.get(name)
+    if cached is None or cached[0] != key:
+        cache[name] = (key, compute())
+        runs[name] = runs.get(name, 0) + 1
+    return cache[name][1]
+
+
+# -----------------------------
+# Section computations
+# -----------------------------
+def compute_kpis(booking_filtered, rollup, rollup_filters):
+    total_travelers = booking_filtered['booking_count'].sum()
+    total_flights = len(booking_filtered)
+    dest_count = booking_filtered.groupby('destination_city')['booking_count'].sum().reset_index()
+    preferred_destination = dest_count.loc[dest_count['booking_count'].idxmax(), 'destination_city']
+
+    # Latest booking month vs previous month, looked up in the precomputed rollup
+    current_month_bookings, growth_pct = rollup.growth(rollup_filters)
+
+    return {
+        'total_travelers': total_travelers,
+        'total_flights': total_flights,
+        'preferred_destination': preferred_destination,
+        'current_month_bookings': current_month_bookings,
+        'growth_pct': growth_pct,
+    }
+
+def compute_age(booking_filtered):
+    import plotly.express as px
+
+    # Pie chart
+    fig = px.pie(
+        booking_filtered,
+        values='booking_count',
+        names='passenger_age',
+        hole=0.3
+    )
+    fig.update_traces(textposition='inside', textinfo='label+percent')
+    fig.update_layout(margin=dict(l=0, r=0, t=10, b=0))
+
+    # Find the age group with maximum passengers
+    max_row = booking_filtered.loc[booking_filtered['booking_count'].idxmax()]
+    max_age_group = max_row['passenger_age']
+
+    # Sum of passengers for that age group only
+    max_count = booking_filtered.loc[booking_filtered['passenger_age'] == max_age_group, 'booking_count'].sum()
+
+    return fig, max_age_group, max_count
+
+def compute_destinations(booking_filtered):
+    import plotly.express as px
+
+    dest_count = booking_filtered.groupby('destination_city')['booking_count'].sum().reset_index()
+    fig_dest = px.bar(dest_count, x='destination_city', y='booking_count', color='destination_city', text='booking_count')
+    fig_dest.update_layout(showlegend=False, xaxis_title='Destination', yaxis_title='Bookings')
+    return fig_dest
+
+def compute_monthly(rollup, rollup_filters):
+    import plotly.express as px
+
+    # Bookings per departure month (January..December) from the precomputed rollup
+    month_group = rollup.departure_month_totals(rollup_filters).round().astype(int)
+
+    fig = px.line(
+        month_group.reset_index(),
+        x='departure_month',
+        y='booking_count',
+        markers=True
+    )
+    # Add quarterly shaded regions
+    quarters = [(0, 2), (3, 5), (6, 8), (9, 11)]  # 0-indexed positions
+    colors = ["grey", "green"]  # alternate colors
+
+    for i, (start, end) in enumerate(quarters):
+        fig.add_vrect(
+            x0=month_order[start],
+            x1=month_order[end],
+            fillcolor=colors[i % 2],
+            opacity=0.1,
+            line_width=0
+        )
+
+    fig.update_layout(
+        xaxis_title="Month",
+        yaxis_title="Number of Passengers"
+    )
+
+    # Quarterly totals
+    quarter_totals = {q: int(round(total)) for q, total in rollup.quarter_totals(rollup_filters).items()}
+
+    return fig, month_group, quarter_totals
+
+def compute_forecast(forecaster, destinations, ages, airlines):
+    import plotly.express as px
+
+    # Observed monthly bookings of the selected series, continued by the forecast
+    history = forecaster.history_totals(destinations, ages, airlines)
+    forecast = forecaster.forecast(12, destinations, ages, airlines)
+
+    fig = px.line(
+        x=period_start(history.index),
+        y=history.round().to_numpy(),
+        markers=True
+    )
+    fig.data[0].name = 'Bookings'
+    fig.data[0].showlegend = True
+    fig.add_scatter(
+        x=period_start(forecast.index),
+        y=forecast.round().to_numpy(),
+        mode='lines+markers',
+        line=dict(dash='dash'),
+        name='Forecast (next 12 months)'
+    )
+    fig.update_layout(
+        xaxis_title="Departure Month",
+        yaxis_title="Number of Passengers"
+    )
+    return fig
+
+def compute_airlines(booking_filtered):
+    import plotly.express as px
 
+    airline_count = booking_filtered.groupby('airline_name')['booking_count'].sum().reset_index()
+    fig_airline = px.bar(airline_count, x='airline_name', y='booking_count', color='airline_name', text='booking_count')
+    fig_airline.update_layout(showlegend=False, xaxis_title='Airline', yaxis_title='Bookings')
+    return fig_airline
+
+def compute_preferences(booking_filtered):
+    import plotly.express as px
+
+    # ------------------ Ticket Type Preference ------------------
+    ticket_pref = booking_filtered.groupby(
+        ['passenger_age', 'ticket_type']
+    )['booking_count'].sum().reset_index()
+
+    fig_ticket = px.bar(
+        ticket_pref,
+        x='passenger_age',
+        y='booking_count',
+        color='ticket_type',
+        barmode='stack',
+        text='booking_count'
+    )
+    fig_ticket.update_layout(
+        xaxis_title="Age Group",
+        yaxis_title="Number of Tickets",
+        legend_title="Ticket Type"
+    )
+
+    # ------------------ Add-on Preferences ------------------
+    # Convert Y/N → 1/0
+    addon_cols = ['business_lounge', 'inflight_entertainment', 'inflight_food']
+    addons = booking_filtered[addon_cols].apply(lambda col: col.astype(str).str.lower().eq('y').astype(int))
+
+    # Handle extra weight: define typical allowance
+    allowance = {'Economy': 23, 'Business': 30, 'First': 40}
+    extra_weight = (booking_filtered['weight_kg'] - booking_filtered['seat_class'].map(allowance).fillna(23)).clip(lower=0)
+
+    # Add this as another "add-on"
+    addons['extra_weight_flag'] = (extra_weight > 0).astype(int)
+    addon_cols_extended = addon_cols + ['extra_weight_flag']
+
+    addon_pref = addons.groupby(booking_filtered['passenger_age'])[addon_cols_extended].mean().reset_index()
+    addon_pref = addon_pref.melt(id_vars='passenger_age', var_name='addon', value_name='preference_rate')
+
+    fig_addon = px.bar(
+        addon_pref,
+        x='passenger_age',
+        y='preference_rate',
+        color='addon',
+        barmode='group',
+        text_auto=True
+    )
+    fig_addon.update_layout(
+        xaxis_title="Age Group",
+        yaxis_title="Preference Rate (0–1)",
+        legend_title="Add-on"
+    )
+
+    # ------------------ Customer Preference Metrics ------------------
+    most_popular_ticket = booking_filtered['ticket_type'].mode()[0]
+    avg_price_per_type = booking_filtered.groupby('ticket_type')['price'].mean().round(2)
+    ticket_stats = pd.DataFrame({
+        "Statistic": [
+            "Most Popular Ticket Type",
+            "Highest Average Price Ticket",
+            "Lowest Average Price Ticket"
+        ],
+        "Value": [
+            most_popular_ticket,
+            avg_price_per_type.idxmax() + f" (${avg_price_per_type.max()})",
+            avg_price_per_type.idxmin() + f" (${avg_price_per_type.min()})"
+        ]
+    })
+
+    # Stats table for add-ons
+    addon_mean = addons[addon_cols_extended].mean().sort_values(ascending=False).round(2)
+    most_popular_addon = addon_mean.index[0]
+    avg_extra_weight = extra_weight.mean().round(1)
+
+    addon_stats = pd.DataFrame({
+        "Statistic": [
+            "Most Popular Add-on",
+            "Average Extra Weight Purchased (kg)",
+            "Add-on with Lowest Uptake"
+        ],
+        "Value": [
+            most_popular_addon,
+            str(avg_extra_weight) + " kg",
+            addon_mean.index[-1]
+        ]
+    })
+
+    return fig_ticket, fig_addon, ticket_stats, addon_stats
+
+def compute_download(database, format_option, save_dir):
+    # Ensure folder exists
+    os.makedirs(save_dir, exist_ok=True)
+
+    # Set filename, MIME type and separator
+    if format_option == "CSV":
+        file_name = "booking_data.csv"
+        mime = "text/csv"
+        sep = ","
+    else:  # TXT
+        file_name = "booking_data.txt"
+        mime = "text/plain"
+        sep = "\t"
+
+    # Save to disk
+    full_path = os.path.join(save_dir, file_name)
+    database.to_csv(full_path, index=False, sep=sep)
+
+    # Save to buffer for download
+    buffer = io.BytesIO()
+    database.to_csv(buffer, index=False, sep=sep)
+
+    return buffer.getvalue(), file_name, mime
+
+
+# -----------------------------
+# Fragments
+# -----------------------------
+@st.fragment
+def download_panel(database, save_dir, generation):
+    # Runs as a fragment: toggling the format only reruns this panel
+    format_option = st.radio("Select file format to download:", ["CSV", "TXT"], horizontal=True)
+
+    data, file_name, mime = run_section(
+        'download', {'format': format_option}, generation,
+        lambda: compute_download(database, format_option, save_dir)
+    )
+
+    # Download button
+    st.download_button(
+        label=f"Download Booking Data as {format_option}",
+        data=data,
+        file_name=file_name,
+        mime=mime
+    )
 
-def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/MyGitHub/Aviation_Analysis/save_folder", rating = []):
+
+def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/MyGitHub/Aviation_Analysis/save_folder", rating = [], generation = None):
     # -----------------------------
     # Dashboard Layout
     # -----------------------------
+    # Plotly is imported on first render so `import app` stays cheap at boot
+    import plotly.io as pio
 
     # Apply custom CSS
     with open("config/theme.css") as f:
@@ -30,15 +329,13 @@ def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/My
     # Title
     st.markdown("<h1 style='padding-top: 0rem; text-align: center;'>✈️ AirTravel Pakistan Insights</h1>", unsafe_allow_html=True)
 
-    month_order = list(calendar.month_name)[1:]  # ['January', 'February', ..., 'December']
-
     # -----------------------------
     # Sidebar Filters
     # -----------------------------
     st.sidebar.header("🔍 Filters")
 
     # Always start from the full dataset
-    df = database.copy()
+    df = database
 
     # ---------------- Year filter ----------------
     year_options = sorted(df["departure_year"].unique())
@@ -47,9 +344,6 @@ def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/My
     if year_filter:
         df = df[df["departure_year"].isin(year_filter)]
 
-    # Define month order explicitly
-    month_order = list(calendar.month_name)[1:]  # ['January', ..., 'December']
-
     # ---------------- Month filter ----------------
     if year_filter:  # only show month if year is selected
         available_months = df["departure_month"].unique()
@@ -91,45 +385,41 @@ def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/My
 
     booking_filtered = df
 
+    filters = {
+        'year': year_filter,
+        'month': month_filter,
+        'destination': destination_filter,
+        'age': age_filter,
+        'airline': airline_filter,
+    }
+
+    def section(name, compute):
+        return run_section(name, filters, generation, lambda: compute(booking_filtered))
+
+    # Calendar rollups, built once per dataset generation
+    rollup = rollup_for(database, generation)
+    rollup_filters = {
+        'departure_year': year_filter,
+        'departure_month': month_filter,
+        'destination_city': destination_filter,
+        'passenger_age': age_filter,
+        'airline_name': airline_filter,
+    }
+
     # -----------------------------
     # KPI Box
     # -----------------------------
     col1, col2, col3, col4 = st.columns(4)  # adjust width ratios
 
-    total_travelers = booking_filtered['booking_count'].sum()
-    total_flights = len(booking_filtered)
-    dest_count = booking_filtered.groupby('destination_city')['booking_count'].sum().reset_index()
-    preferred_destination = dest_count.loc[dest_count['booking_count'].idxmax(), 'destination_city']
-    
-    # Get current month (latest month in your data)
-    # Make sure booking_date is datetime
-    booking_filtered['booking_date'] = pd.to_datetime(booking_filtered['booking_date'])
-
-    # Extract normalized month (first day of each month)
-    booking_filtered['month'] = booking_filtered['booking_date'].dt.to_period('M').dt.to_timestamp()
-
-    # Find current and previous months
-    current_month = booking_filtered['month'].max()
-    previous_month = current_month - pd.DateOffset(months=1)
-
-    # Aggregate bookings by month
-    monthly_bookings = booking_filtered.groupby('month')['booking_count'].sum()
-
-    # Lookup values
-    current_month_bookings = monthly_bookings.get(current_month, 0)
-    previous_month_bookings = monthly_bookings.get(previous_month, 0)
-
-    # Growth %
-    if previous_month_bookings > 0:
-        growth_pct = ((current_month_bookings - previous_month_bookings) / previous_month_bookings) * 100
-    else:
-        growth_pct = None
+    kpis = section('kpis', lambda df: compute_kpis(df, rollup, rollup_filters))
+    growth_pct = kpis['growth_pct']
 
     # Display metric
-    col1.metric("👥 Total Travelers", f"{total_travelers:,}")
-    col2.metric("🛫 Total Flights", f"{total_flights:,}")
-    col3.metric("🏝️ Preferred Destination", preferred_destination)
-    col4.metric("📈 Booking Growth", f"{current_month_bookings:,}", f"{growth_pct:+.1f}% vs last month")
+    col1.metric("👥 Total Travelers", f"{kpis['total_travelers']:,}")
+    col2.metric("🛫 Total Flights", f"{kpis['total_flights']:,}")
+    col3.metric("🏝️ Preferred Destination", kpis['preferred_destination'])
+    col4.metric("📈 Booking Growth", f"{kpis['current_month_bookings']:,}",
+                f"{growth_pct:+.1f}% vs last month" if growth_pct is not None else None)
 
     # ----------------------------
     # Graphics
@@ -140,25 +430,10 @@ def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/My
         # Subheader with minimal margin
         st.subheader("Passenger Age")
 
-        # Pie chart
-        fig = px.pie(
-            booking_filtered,
-            values='booking_count',
-            names='passenger_age',
-            hole=0.3
-        )
-        fig.update_traces(textposition='inside', textinfo='label+percent')
-        fig.update_layout(margin=dict(l=0, r=0, t=10, b=0))
+        fig, max_age_group, max_count = section('age', compute_age)
         st.plotly_chart(fig, use_container_width=True, height=200)
 
         # ---------------- Metric box ----------------
-        # Find the age group with maximum passengers
-        max_row = booking_filtered.loc[booking_filtered['booking_count'].idxmax()]
-        max_age_group = max_row['passenger_age']
-        
-        # Sum of passengers for that age group only
-        max_count = booking_filtered.loc[booking_filtered['passenger_age'] == max_age_group, 'booking_count'].sum()
-
         with st.expander('View Matrics'):
             st.write(f"Most Frequent Age Group: {max_age_group}")
             st.write(f"Number of Passenger: {max_count}")
@@ -166,220 +441,69 @@ def dashboard(database, title = "FlightHub Pakistan", save_dir = "E:/MyFolder/My
     with col2:
         # Bar Graph for number of bookings per destination
         st.subheader("Bookings per Destination")
-        fig_dest = px.bar(dest_count, x='destination_city', y='booking_count', color='destination_city', text='booking_count')
-        fig_dest.update_layout(showlegend=False, xaxis_title='Destination', yaxis_title='Bookings')
+        fig_dest = section('destinations', compute_destinations)
         st.plotly_chart(fig_dest, use_container_width=True, height=300)
-        
+
     # Line graph for monthly bookings (seperate line in the same graph for the year filter applied) -> there should be coloured bins in the chart showing Quaterly division of the year
     st.subheader("Monthly Bookings")
 
-    # Convert to categorical with order
-    booking_filtered['departure_month'] = pd.Categorical(
-        booking_filtered['departure_month'],
-        categories=month_order,
-        ordered=True
-    )
-
-    # Now your line chart will respect month order
-    fig = px.line(
-        booking_filtered.groupby('departure_month')['booking_count'].sum().reset_index(),
-        x='departure_month',
-        y='booking_count',
-        markers=True
-    )
-    # Add quarterly shaded regions
-    quarters = [(0, 2), (3, 5), (6, 8), (9, 11)]  # 0-indexed positions
-    colors = ["grey", "green"]  # alternate colors
-
-    for i, (start, end) in enumerate(quarters):
-        fig.add_vrect(
-            x0=month_order[start],
-            x1=month_order[end],
-            fillcolor=colors[i % 2],
-            opacity=0.1,
-            line_width=0
-        )
-
-    fig.update_layout(
-        xaxis_title="Month",
-        yaxis_title="Number of Passengers"
-    )
-
+    fig, month_group, quarter_totals = section('monthly', lambda df: compute_monthly(rollup, rollup_filters))
     st.plotly_chart(fig, use_container_width=True, height=300)
 
     # Metrics under the chart
     with st.expander("View Monthly Booking Metrics"):
-        # Group by month for metrics
-        month_group = booking_filtered.groupby('departure_month')['booking_count'].sum()
         max_month = month_group.idxmax()
         min_month = month_group.idxmin()
         avg_month = month_group.mean()
-        
+
         st.write(f"Month with Maximum Bookings: {max_month} ({month_group[max_month]} bookings)")
         st.write(f"Month with Minimum Bookings: {min_month} ({month_group[min_month]} bookings)")
         st.write(f"Average Bookings per Month: {avg_month:.1f}")
-        
-        # Quarterly totals
-        quarters = {
-            "Q1": ['January','February','March'],
-            "Q2": ['April','May','June'],
-            "Q3": ['July','August','September'],
-            "Q4": ['October','November','December']
-        }
+
         st.write("Total Bookings per Quarter:")
-        for q, months in quarters.items():
-            q_total = month_group.loc[month_group.index.intersection(months)].sum()
+        for q, q_total in quarter_totals.items():
             st.write(f"{q}: {q_total}")
-        
+
+    # Forecast for the selected destinations/age groups/airlines (all series if none selected)
+    forecaster = forecaster_for(database, generation)
+    if forecaster is not None:
+        st.subheader("Booking Forecast")
+        fig_forecast = run_section(
+            'forecast', filters, generation,
+            lambda: compute_forecast(forecaster, destination_filter, age_filter, airline_filter)
+        )
+        st.plotly_chart(fig_forecast, use_container_width=True, height=300)
+
     # bar garph for preffered airline based on number of bookings (col 1)
     st.subheader("Bookings per Airline")
-    airline_count = booking_filtered.groupby('airline_name')['booking_count'].sum().reset_index()
-    fig_airline = px.bar(airline_count, x='airline_name', y='booking_count', color='airline_name', text='booking_count')
-    fig_airline.update_layout(showlegend=False, xaxis_title='Airline', yaxis_title='Bookings')
+    fig_airline = section('airlines', compute_airlines)
     st.plotly_chart(fig_airline, use_container_width=True, height=300)
 
     with st.expander("View Airline ratings"):
         st.table(rating[['airline_name', 'rating']])
 
+    fig_ticket, fig_addon, ticket_stats, addon_stats = section('preferences', compute_preferences)
+
     col1, col2 = st.columns(2)
 
     # ------------------ Left Column: Ticket Type Preference ------------------
     with col1:
         st.markdown("#### Ticket Type Preference by Age Group")
-
-        ticket_pref = booking_filtered.groupby(
-            ['passenger_age', 'ticket_type']
-        )['booking_count'].sum().reset_index()
-
-        fig_ticket = px.bar(
-            ticket_pref,
-            x='passenger_age',
-            y='booking_count',
-            color='ticket_type',
-            barmode='stack',
-            text='booking_count'
-        )
-        fig_ticket.update_layout(
-            xaxis_title="Age Group",
-            yaxis_title="Number of Tickets",
-            legend_title="Ticket Type"
-        )
         st.plotly_chart(fig_ticket, use_container_width=True, height=400)
 
     # ------------------ Right Column: Add-on Preferences ------------------
     with col2:
         st.markdown("#### Add-on Preferences by Age Group")
-
-        # Convert Y/N → 1/0
-        addon_cols = ['business_lounge', 'inflight_entertainment', 'inflight_food']
-        booking_filtered[addon_cols] = booking_filtered[addon_cols].applymap(lambda x: 1 if str(x).lower() == 'y' else 0)
-
-        # Handle extra weight: define typical allowance
-        allowance = {'Economy': 23, 'Business': 30, 'First': 40}
-        booking_filtered['extra_weight'] = booking_filtered.apply(
-            lambda row: max(row['weight_kg'] - allowance.get(row['seat_class'], 23), 0), axis=1
-        )
-        booking_filtered['extra_weight_flag'] = booking_filtered['extra_weight'].apply(lambda x: 1 if x > 0 else 0)
-
-        # Add this as another "add-on"
-        addon_cols_extended = addon_cols + ['extra_weight_flag']
-
-        addon_pref = booking_filtered.groupby('passenger_age')[addon_cols_extended].mean().reset_index()
-        addon_pref = addon_pref.melt(id_vars='passenger_age', var_name='addon', value_name='preference_rate')
-
-        fig_addon = px.bar(
-            addon_pref,
-            x='passenger_age',
-            y='preference_rate',
-            color='addon',
-            barmode='group',
-            text_auto=True
-        )
-        fig_addon.update_layout(
-            xaxis_title="Age Group",
-            yaxis_title="Preference Rate (0–1)",
-            legend_title="Add-on"
-        )
         st.plotly_chart(fig_addon, use_container_width=True, height=400)
 
     with st.expander("View Customer Preferance Metrics"):
-        most_popular_ticket = booking_filtered['ticket_type'].mode()[0]
-        avg_price_per_type = booking_filtered.groupby('ticket_type')['price'].mean().round(2)
-        ticket_stats = pd.DataFrame({
-            "Statistic": [
-                "Most Popular Ticket Type",
-                "Highest Average Price Ticket",
-                "Lowest Average Price Ticket"
-            ],
-            "Value": [
-                most_popular_ticket,
-                avg_price_per_type.idxmax() + f" (${avg_price_per_type.max()})",
-                avg_price_per_type.idxmin() + f" (${avg_price_per_type.min()})"
-            ]
-        })
-
         st.markdown("Key Ticket Insights")
         st.table(ticket_stats)
 
-        # Stats table for add-ons
-        addon_mean = booking_filtered[addon_cols_extended].mean().sort_values(ascending=False).round(2)
-        most_popular_addon = addon_mean.index[0]
-        avg_extra_weight = booking_filtered['extra_weight'].mean().round(1)
-
-        addon_stats = pd.DataFrame({
-            "Statistic": [
-                "Most Popular Add-on",
-                "Average Extra Weight Purchased (kg)",
-                "Add-on with Lowest Uptake"
-            ],
-            "Value": [
-                most_popular_addon,
-                str(avg_extra_weight) + " kg",
-                addon_mean.index[-1]
-            ]
-        })
-
         st.markdown("Key Add-on Insights")
         st.table(addon_stats)
 
     col1, col2 = st.columns([9,3])
 
     with col2:
-        # Let user select format
-        format_option = st.radio("Select file format to download:", ["CSV", "TXT"], horizontal=True)
-
-        # Ensure folder exists
-        os.makedirs(save_dir, exist_ok=True)
-
-        # Set filename and MIME type
-        if format_option == "CSV":
-            file_name = "booking_data.csv"
-            mime = "text/csv"
-            full_path = os.path.join(save_dir, file_name)
-
-            # Save to disk
-            database.to_csv(full_path, index=False)
-
-            # Save to buffer for download
-            buffer = io.BytesIO()
-            database.to_csv(buffer, index=False)
-
-        else:  # TXT
-            file_name = "booking_data.txt"
-            mime = "text/plain"
-            full_path = os.path.join(save_dir, file_name)
-
-            # Save to disk
-            database.to_csv(full_path, index=False, sep="\t")
-
-            # Save to buffer for download
-            buffer = io.BytesIO()
-            database.to_csv(buffer, index=False, sep="\t")
-
-        # Download button
-        st.download_button(
-            label=f"Download Booking Data as {format_option}",
-            data=buffer.getvalue(),
-            file_name=file_name,
-            mime=mime
-        )
+        download_panel(database, save_dir, generation)
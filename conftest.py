@@ -0,0 +1 @@
+# Keeps the project root importable (src.*, main) when running pytest
@@ -1,15 +1,21 @@
 from src.database import load_tables
 from src.wrangling import wrangle_data
 from src.merge import merge_dataframes
+from src.snapshot import load_snapshot, publish_snapshot, start_background_refresh
 from src.utils import database_insight
 from warnings import filterwarnings
 from app import dashboard
 import streamlit as st
+import os
 
 
 filterwarnings("ignore")  # Suppress warnings for cleaner output
 
-def main():
+# "snapshot": serve the last published snapshot and refresh it in the background
+# "fresh": always wait for the full database load
+BOOT_MODE = os.getenv("BOOT_MODE", "snapshot")
+
+def build_dataframes():
 
     # 1. Load raw tables from DB
     dfs = load_tables()
@@ -18,16 +24,40 @@ def main():
     dfs = wrangle_data(dfs)
 
     # 3. Merge & generate final DataFrames
-    flight_merged_df, booking_df, airline_merged_df = merge_dataframes(dfs)
+    return merge_dataframes(dfs)
+
+def report(frames, generation):
 
     # 4. Display summary of final DataFrames using utility
-    # database_insight(flight_merged_df, name="Flight Merged DataFrame")
-    # database_insight(booking_df, name="Booking DataFrame")
-    # database_insight(airline_merged_df, name="Airline Merged DataFrame")
+    # Runs once per published snapshot; profiles are sampled and cached per generation
+    flight_merged_df, booking_df, airline_merged_df = frames
+    database_insight(flight_merged_df, name="Flight Merged DataFrame", generation=generation)
+    database_insight(booking_df, name="Booking DataFrame", generation=generation)
+    database_insight(airline_merged_df, name="Airline Merged DataFrame", generation=generation)
+
+@st.cache_resource
+def build_and_publish():
+
+    # Cached for the process: Streamlit reruns (every widget click) reuse the same
+    # frames and generation instead of republishing the snapshot and reprinting the report
+    frames = build_dataframes()
+    generation = publish_snapshot(frames)
+    report(frames, generation)
+    return frames, generation
+
+def main():
 
-    dashboard(booking_df, rating = airline_merged_df)
+    frames, generation = load_snapshot() if BOOT_MODE == "snapshot" else (None, None)
+
+    if frames is None:
+        frames, generation = build_and_publish()
+    else:
+        start_background_refresh(build_dataframes, on_publish=report)
+
+    flight_merged_df, booking_df, airline_merged_df = frames
+
+    dashboard(booking_df, rating = airline_merged_df, generation = generation)
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,35 +1,81 @@
-from tqdm import tqdm
 import pandas as pd
-import pymysql as mysql
 import os
 import streamlit as st
-from dotenv import load_dotenv
 
-load_dotenv()
+def get_connection(streaming=False):
+    """
+    Open a database connection.
+
+    Args:
+        streaming: use an unbuffered server-side cursor, so rows are fetched as they
+            are read instead of the whole result set being buffered client-side.
+    """
+    # Driver and .env loading are deferred until a connection is actually needed
+    import pymysql as mysql
+    from dotenv import load_dotenv
 
-def get_connection():
+    load_dotenv()
     return mysql.connect(
         host=os.getenv("DB_HOST"),
         user=os.getenv("DB_USER"),
         password=os.getenv("DB_PASSWORD"),
         database=os.getenv("DB_NAME"),
+        cursorclass=mysql.cursors.SSCursor if streaming else mysql.cursors.Cursor,
     )
 
+def _set_id_index(df):
+    # Automatically set index if first column is *_id
+    first_col = df.columns[0]
+    if "_id" in first_col:
+        df.set_index(first_col, inplace=True)
+    return df
+
+def query_scalar(query):
+    """Run a query returning a single value (e.g. an aggregate) and return it."""
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query)
+        return cursor.fetchone()[0]
+    finally:
+        conn.close()
+
+def iter_table_chunks(table, chunk_size=50000):
+    """
+    Stream a table from the database chunk by chunk without loading it whole.
+
+    Args:
+        table: table name.
+        chunk_size: number of rows per chunk.
+
+    Yields:
+        DataFrame chunks, indexed like load_tables.
+    """
+    conn = get_connection(streaming=True)
+    try:
+        for chunk in pd.read_sql(f"SELECT * FROM {table};", conn, chunksize=chunk_size):
+            yield _set_id_index(chunk)
+    finally:
+        conn.close()
+
 @st.cache_data
-def load_tables(chunk_size=1000):
+def load_tables(chunk_size=1000, exclude=()):
     """
     Load all tables from the database into pandas DataFrames with per-table progress bars.
     
     Args:
         chunk_size: number of rows to fetch per chunk for smooth progress bar updates.
+        exclude: table names to skip (e.g. ('booking',) when bookings are streamed).
     
     Returns:
         dfs: dictionary of table_name -> DataFrame
     """
+    from tqdm import tqdm
+
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SHOW TABLES;")
-    tables = [t[0] for t in cursor.fetchall()]
+    tables = [t[0] for t in cursor.fetchall() if t[0] not in exclude]
     
     dfs = {}
 
@@ -49,12 +95,7 @@ def load_tables(chunk_size=1000):
             pbar.update(len(chunk))
         
         pbar.close()
-        df = pd.concat(df_chunks, ignore_index=True)
-
-        # Automatically set index if first column is *_id
-        first_col = df.columns[0]
-        if "_id" in first_col:
-            df.set_index(first_col, inplace=True)
+        df = _set_id_index(pd.concat(df_chunks, ignore_index=True))
 
         dfs[table] = df
         print(f"✅ Completed loading '{table}' ({total_rows} rows)\n")
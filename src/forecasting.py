@@ -0,0 +1,199 @@
+# forecasting.py
+import calendar
+import copy
+import threading
+import numpy as np
+import pandas as pd
+
+SERIES_KEYS = ['destination_city', 'passenger_age', 'airline_name']
+
+MONTH_NUMBER = {name: i for i, name in enumerate(calendar.month_name) if name}
+
+_forecaster_lock = threading.Lock()
+_latest_forecaster = None  # (generation, DemandForecaster)
+
+
+def departure_periods(booking_df):
+    """Departure month of every booking as an integer period (year * 12 + month - 1), NaN if unknown."""
+    month = booking_df['departure_month'].astype(str).map(MONTH_NUMBER)
+    return (booking_df['departure_year'] * 12 + month - 1).rename('period')
+
+
+def monthly_series(booking_df):
+    """
+    Monthly booking totals (by departure month) for every destination x age group x airline series.
+
+    Returns:
+        DataFrame with one row per (destination_city, passenger_age, airline_name) and one
+        column per month, as an integer period (year * 12 + month - 1); missing months are 0.
+    """
+    period = departure_periods(booking_df)
+    valid = period.notna()
+
+    totals = booking_df.loc[valid, 'booking_count'].groupby(
+        [booking_df.loc[valid, key] for key in SERIES_KEYS] + [period[valid].astype(int)],
+        observed=True
+    ).sum()
+    series = totals.unstack('period', fill_value=0)
+    if series.empty:
+        return series
+
+    periods = np.arange(series.columns.min(), series.columns.max() + 1)
+    return series.reindex(columns=periods, fill_value=0).astype(float)
+
+
+def period_start(periods):
+    """Integer periods (year * 12 + month - 1) -> first day of the month."""
+    periods = np.asarray(periods)
+    return pd.to_datetime({'year': periods // 12, 'month': periods % 12 + 1, 'day': 1})
+
+
+class DemandForecaster:
+    """
+    Seasonal regression (intercept + linear trend + month-of-year dummies) fitted to all
+    destination x age group x airline series at once.
+
+    Every series shares the same design matrix X, so the model is kept as the sufficient
+    statistics X'X (shared) and X'Y (one column per series). All coefficients come from
+    one solve with a right-hand side per series, which runs on numpy's multithreaded
+    BLAS/LAPACK across cores. A new month is folded into X'X and X'Y without refitting.
+    """
+
+    N_FEATURES = 13  # intercept, trend, 11 month dummies
+
+    def __init__(self):
+        self.origin = None
+        self.history = None
+        self.xtx = np.zeros((self.N_FEATURES, self.N_FEATURES))
+        self.xty = None
+        self.beta = None
+
+    def _design(self, periods):
+        periods = np.asarray(periods)
+        X = np.zeros((len(periods), self.N_FEATURES))
+        X[:, 0] = 1.0
+        X[:, 1] = periods - self.origin
+        month = periods % 12
+        has_dummy = month > 0  # January is the baseline
+        X[np.flatnonzero(has_dummy), 1 + month[has_dummy]] = 1.0
+        return X
+
+    def _solve(self):
+        # Minimum-norm solution, so fewer than 13 months of history still fit
+        self.beta = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0]
+
+    @property
+    def last_period(self):
+        """Last observed month; its bookings may still grow, so update() revises it."""
+        return int(self.history.columns.max())
+
+    def fit(self, series):
+        """
+        Fit every series in one batched solve.
+
+        Args:
+            series: output of monthly_series.
+        """
+        self.origin = int(series.columns.min())
+        self.history = series
+        X = self._design(series.columns)
+        self.xtx = X.T @ X
+        self.xty = X.T @ series.to_numpy().T
+        self._solve()
+        return self
+
+    def update(self, series):
+        """
+        Fold the latest months into the model without refitting.
+
+        Only months from last_period on are read: the last observed month is revised
+        (its X'X row is already in, only Y changes) and later months are appended.
+        Earlier months are taken as final. Series not seen before start from zero.
+
+        Args:
+            series: output of monthly_series on the bookings departing from last_period on.
+        """
+        if self.history is None:
+            return self.fit(series)
+
+        last = self.last_period
+        series = series.loc[:, series.columns >= last]
+        end = int(series.columns.max()) if len(series.columns) else last
+        periods = np.arange(last, end + 1)
+
+        # New series: zero history and zero X'Y so far
+        index = self.history.index.union(series.index)
+        if len(index) > len(self.history.index):
+            self.xty = pd.DataFrame(self.xty.T, index=self.history.index).reindex(index, fill_value=0).to_numpy().T
+        history = self.history.reindex(index=index, fill_value=0)
+        new = series.reindex(index=index, columns=periods, fill_value=0)
+
+        X = self._design(periods)
+        delta = new.to_numpy(copy=True)
+        delta[:, 0] -= history[last].to_numpy()  # revise the last month
+        self.xtx = self.xtx + X[1:].T @ X[1:]      # only the appended months are new rows
+        self.xty = self.xty + X.T @ delta.T
+
+        self.history = pd.concat([history.drop(columns=last), new], axis=1)
+        self._solve()
+        return self
+
+    def _mask(self, destinations=None, ages=None, airlines=None):
+        # Series matching the selected values (empty/None means no filter)
+        mask = np.ones(len(self.history.index), dtype=bool)
+        for key, selected in zip(SERIES_KEYS, (destinations, ages, airlines)):
+            if selected is not None and len(selected) > 0:
+                mask &= self.history.index.get_level_values(key).isin(list(selected))
+        return mask
+
+    def history_totals(self, destinations=None, ages=None, airlines=None):
+        """Observed monthly bookings of the selected series, indexed by integer period."""
+        mask = self._mask(destinations, ages, airlines)
+        return pd.Series(self.history.to_numpy()[mask].sum(axis=0), index=self.history.columns, name='history')
+
+    def forecast(self, horizon=12, destinations=None, ages=None, airlines=None):
+        """
+        Forecast the next `horizon` months after the last observed month.
+
+        Args:
+            horizon: number of months to forecast.
+            destinations / ages / airlines: optional lists restricting the series that are summed.
+
+        Returns:
+            Series of forecast bookings indexed by integer period (year * 12 + month - 1).
+        """
+        periods = np.arange(self.last_period + 1, self.last_period + 1 + horizon)
+
+        mask = self._mask(destinations, ages, airlines)
+        predictions = self._design(periods) @ self.beta[:, mask]
+        return pd.Series(np.clip(predictions, 0, None).sum(axis=1), index=periods, name='forecast')
+
+
+def forecaster_for(booking_df, generation=None):
+    """
+    Return the forecaster for a dataset generation.
+
+    The model is kept per generation and shared by every rerun and session. When a new
+    generation arrives, only the bookings departing in the previous model's last month
+    or later are aggregated and folded in (see DemandForecaster.update). Without a
+    generation the model is fitted from scratch. Returns None when there is no monthly
+    data to fit.
+    """
+    global _latest_forecaster
+    with _forecaster_lock:
+        if generation is not None and _latest_forecaster is not None and _latest_forecaster[0] == generation:
+            return _latest_forecaster[1]
+
+        if generation is None or _latest_forecaster is None:
+            series = monthly_series(booking_df)
+            if series.empty:
+                return None
+            forecaster = DemandForecaster().fit(series)
+        else:
+            previous = _latest_forecaster[1]
+            recent = booking_df[(departure_periods(booking_df) >= previous.last_period).to_numpy()]
+            forecaster = copy.deepcopy(previous).update(monthly_series(recent))
+
+        if generation is not None:
+            _latest_forecaster = (generation, forecaster)
+        return forecaster
@@ -0,0 +1,107 @@
+# inventory.py
+import numpy as np
+import pandas as pd
+
+
+class SeatInventory:
+    """
+    Seat capacity and seats sold per flight, stored as arrays indexed by flight position.
+
+    Flights whose capacity is unknown (no airplane / airplane type) are treated as
+    unlimited, and bookings on flights missing from the inventory are always admitted.
+    """
+
+    def __init__(self, flight_ids, capacity):
+        self.flight_index = pd.Index(flight_ids)
+        capacity = np.asarray(capacity, dtype=float)
+        self.capacity = np.where(np.isnan(capacity), np.inf, capacity)
+        self.seats_sold = np.zeros(len(self.flight_index), dtype=np.int64)
+
+    @classmethod
+    def from_tables(cls, flight, airplane, airplane_type):
+        """
+        Build the inventory from the flight, airplane and airplane_type tables
+        (each indexed by its own id).
+        """
+        type_id = flight['airplane_id'].map(airplane['type_id'])
+        capacity = type_id.map(airplane_type['capacity'])
+        return cls(flight.index, capacity.to_numpy(dtype=float))
+
+    def positions(self, flight_ids):
+        """Return the array position of each flight_id (-1 if unknown)."""
+        return self.flight_index.get_indexer(flight_ids)
+
+    def _admit_at(self, pos, num_passengers):
+        if self.seats_sold[pos] + num_passengers <= self.capacity[pos]:
+            self.seats_sold[pos] += num_passengers
+            return num_passengers
+        return 0
+
+    def admit(self, flight_id, num_passengers):
+        """
+        Admit a single booking in O(1).
+
+        Returns:
+            Seats granted: num_passengers if the booking fits, otherwise 0.
+        """
+        try:
+            pos = self.flight_index.get_loc(flight_id)
+        except KeyError:
+            return num_passengers
+        return self._admit_at(pos, num_passengers)
+
+    def admit_batch(self, flight_ids, num_passengers):
+        """
+        Admit a batch of bookings in order.
+
+        Each flight's bookings up to its first overflow are admitted in one vectorized
+        step. After that, bookings larger than the seats left are rejected at once and
+        only the rest are admitted one by one, so the result is the same as calling
+        `admit` for every booking.
+
+        Args:
+            flight_ids: flight_id of each booking.
+            num_passengers: seats requested by each booking.
+
+        Returns:
+            np.ndarray of seats granted per booking (0 for rejected bookings).
+        """
+        pos = self.positions(flight_ids)
+        requested = np.asarray(num_passengers, dtype=np.int64)
+        granted = requested.copy()
+
+        known = pos >= 0
+        kpos = pos[known]
+        kreq = requested[known]
+        if len(kpos) == 0:
+            return granted
+
+        # Running seat total per flight if every booking in the batch were admitted;
+        # a booking is in its flight's fitting prefix until the first overflow
+        running = pd.Series(kreq).groupby(kpos).cumsum().to_numpy() + self.seats_sold[kpos]
+        overflow = running > self.capacity[kpos]
+        after_overflow = pd.Series(overflow).groupby(kpos).cummax().to_numpy()
+
+        prefix = ~after_overflow
+        self.seats_sold += np.bincount(kpos[prefix], weights=kreq[prefix], minlength=len(self.seats_sold)).astype(np.int64)
+
+        # Free seats only shrink from here, so a later booking larger than what is left
+        # after the prefix can never fit; only the remaining ones are admitted one by one
+        kgranted = kreq.copy()
+        may_fit = after_overflow & (kreq <= self.capacity[kpos] - self.seats_sold[kpos])
+        kgranted[after_overflow & ~may_fit] = 0
+        for i in np.flatnonzero(may_fit):
+            kgranted[i] = self._admit_at(kpos[i], kreq[i])
+
+        granted[known] = kgranted
+        return granted
+
+    def load_factor(self):
+        """
+        Return seats sold / capacity per flight as a Series indexed by flight_id.
+        Flights with unknown or zero capacity get NaN.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            load_factor = self.seats_sold / self.capacity
+        load_factor[~np.isfinite(self.capacity) | (self.capacity <= 0)] = np.nan
+        return pd.Series(load_factor, index=self.flight_index, name='load_factor')
@@ -3,17 +3,12 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 
-@st.cache_data
-def merge_dataframes(dfs):
+def merge_flight_dimensions(dfs):
     """
-    Merge the raw dfs into three main DataFrames:
-    - flight_merged_df
-    - booking_df
-    - airline_merged_df
+    Join flight with airplane, airplane_type, airline and airport.
+    Only the small dimension tables are used, so this is cheap even when
+    the booking table is too large to load.
     """
-    # ------------------------- Airline Merged DataFrame ------------------------- #
-    airline_merged_df = dfs['airline'].copy()
-
     # ------------------------- Airplane Merged DataFrame ------------------------- #
     airplane_merged_df = dfs['airplane'].merge(
         dfs['airplane_type'],
@@ -63,6 +58,22 @@ def merge_dataframes(dfs):
     # Drop unnecessary ID columns
     flight_merged_df.drop(columns=['airline_id', 'airplane_id', 'origin_airport_id', 'dest_airport_id'], inplace=True)
 
+    return flight_merged_df
+
+@st.cache_data
+def merge_dataframes(dfs):
+    """
+    Merge the raw dfs into three main DataFrames:
+    - flight_merged_df
+    - booking_df
+    - airline_merged_df
+    """
+    # ------------------------- Airline Merged DataFrame ------------------------- #
+    airline_merged_df = dfs['airline'].copy()
+
+    # Flight joined with airplane, airline and airport info
+    flight_merged_df = merge_flight_dimensions(dfs)
+
     # Add booking counts
     # Add booking counts based on passengers
     booking_counts = dfs['booking'].groupby('flight_id')['num_passengers'].sum().reset_index(name='booking_count')
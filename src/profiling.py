@@ -0,0 +1,259 @@
+# profiling.py
+import json
+import warnings
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Frames larger than this are profiled on a reservoir sample by default
+DEFAULT_SAMPLE_SIZE = 100000
+
+# Number of minimum hash values kept by the cardinality estimator
+CARDINALITY_K = 1024
+
+
+## ------------------------- SAMPLING ------------------------- ##
+def reservoir_sample(chunks, sample_size, random_state=0):
+    """
+    Uniform random sample of sample_size rows from a stream of DataFrame chunks.
+
+    Every row gets a random priority and the sample_size rows with the smallest
+    priorities are kept, chunk by chunk, so only one chunk plus the reservoir is in
+    memory at a time (e.g. the chunks of src.streaming).
+
+    Args:
+        chunks: iterable of DataFrames with the same columns.
+        sample_size: number of rows to keep.
+        random_state: seed for reproducible samples.
+
+    Returns:
+        (sample, rows_seen)
+    """
+    rng = np.random.default_rng(random_state)
+    reservoir, priorities = None, np.empty(0)
+    rows_seen = 0
+
+    for chunk in chunks:
+        rows_seen += len(chunk)
+        chunk_priorities = rng.random(len(chunk))
+        if reservoir is None:
+            reservoir, priorities = chunk, chunk_priorities
+        else:
+            reservoir = pd.concat([reservoir, chunk])
+            priorities = np.concatenate([priorities, chunk_priorities])
+
+        if len(reservoir) > sample_size:
+            keep = np.argpartition(priorities, sample_size - 1)[:sample_size]
+            keep.sort()
+            reservoir, priorities = reservoir.iloc[keep], priorities[keep]
+
+    return reservoir, rows_seen
+
+
+## ------------------------- COLUMN STATISTICS ------------------------- ##
+def estimate_cardinality(series, k=CARDINALITY_K):
+    """
+    Estimate the number of distinct non-null values of a Series from its k smallest
+    64-bit hashes (KMV estimator). Exact when the column has fewer than k distinct values.
+    """
+    hashes = pd.util.hash_pandas_object(series.dropna(), index=False).to_numpy()
+    if len(hashes) <= 4 * k:
+        smallest = np.unique(hashes)
+    else:
+        smallest = np.unique(np.partition(hashes, 4 * k)[:4 * k])
+        if len(smallest) < k:
+            smallest = np.unique(hashes)
+
+    if len(smallest) < k:
+        return int(len(smallest))
+    return int((k - 1) / (smallest[k - 1] / 2.0 ** 64))
+
+def _as_float_matrix(frame):
+    # datetime/timedelta -> float nanoseconds with NaT as NaN
+    values = frame.to_numpy()
+    if values.dtype.kind in 'mM':
+        values = values.astype('timedelta64[ns]' if values.dtype.kind == 'm' else 'datetime64[ns]')
+        missing = np.isnat(values)
+        values = values.astype('int64').astype(float)
+        values[missing] = np.nan
+        return values
+    return frame.to_numpy(dtype=float, na_value=np.nan)
+
+def _matrix_stats(values):
+    # One vectorized pass over a 2D (rows x columns) float array
+    with warnings.catch_warnings(), np.errstate(all='ignore'):
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        q25, q50, q75 = np.nanpercentile(values, [25, 50, 75], axis=0)
+        return {
+            'mean': np.nanmean(values, axis=0),
+            'std': np.nanstd(values, axis=0, ddof=1),
+            'min': np.nanmin(values, axis=0),
+            '25%': q25,
+            '50%': q50,
+            '75%': q75,
+            'max': np.nanmax(values, axis=0),
+        }
+
+def _clean(value):
+    # numpy scalars / NaN -> JSON friendly Python values
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+        return None if isinstance(value, float) and np.isnan(value) else value
+    return value
+
+
+## ------------------------- PROFILE ------------------------- ##
+def profile_dataframe(df, name="DataFrame", sample_size=DEFAULT_SAMPLE_SIZE, random_state=0):
+    """
+    Compute column statistics for a DataFrame.
+
+    Statistics are computed in one vectorized pass per dtype group (numeric, timedelta,
+    datetime); nulls, cardinality estimates and memory are computed for every column.
+    Frames with more than sample_size rows are profiled on a reservoir sample and
+    counts are scaled back to the full row count. Cardinality is always estimated on
+    the full column (one hashing pass), since distinct counts do not scale with a sample.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to profile.
+        name (str): Name of the database/table.
+        sample_size (int): Sample size for large frames (None profiles every row).
+        random_state (int): Seed of the sample.
+
+    Returns:
+        profile: dictionary with the frame summary and one entry per column.
+    """
+    rows = len(df)
+    sampled = sample_size is not None and rows > sample_size
+    data = reservoir_sample([df], sample_size, random_state)[0] if sampled else df
+    scale = rows / len(data) if len(data) else 1.0
+
+    nulls = data.isna().sum() * scale
+    memory = data.memory_usage(deep=True, index=False) * scale
+
+    columns = {}
+    for col, dtype in data.dtypes.items():
+        columns[col] = {
+            'dtype': str(dtype),
+            'null_count': int(round(nulls[col])),
+            'null_fraction': _clean(nulls[col] / rows) if rows else 0.0,
+            'cardinality': estimate_cardinality(df[col]),
+            'memory_bytes': int(round(memory[col])),
+        }
+
+    # Numeric columns (describe-style stats)
+    numeric = data.select_dtypes(include='number')
+    if not numeric.empty:
+        stats = _matrix_stats(_as_float_matrix(numeric))
+        for i, col in enumerate(numeric.columns):
+            columns[col]['stats'] = {stat: _clean(values[i]) for stat, values in stats.items()}
+
+    # Timedelta and datetime columns (stats reported as strings)
+    for include, converter in (('timedelta', pd.to_timedelta), ('datetime', pd.to_datetime)):
+        group = data.select_dtypes(include=include)
+        if group.empty:
+            continue
+        stats = _matrix_stats(_as_float_matrix(group))
+        for i, col in enumerate(group.columns):
+            columns[col]['stats'] = {
+                stat: None if np.isnan(values[i]) else str(converter(values[i], unit='ns'))
+                for stat, values in stats.items() if stat != 'std'
+            }
+
+    return {
+        'name': name,
+        'rows': rows,
+        'columns_count': df.shape[1],
+        'sampled': sampled,
+        'sample_rows': len(data),
+        'memory_bytes': int(sum(c['memory_bytes'] for c in columns.values())),
+        'columns': columns,
+    }
+
+@st.cache_data
+def profile_generation(_df, name, generation, sample_size=DEFAULT_SAMPLE_SIZE):
+    """
+    profile_dataframe cached per dataset generation (e.g. snapshot_generation()), so it
+    can run on every rerun/refresh and only recomputes when a new dataset is published.
+    The DataFrame itself is not hashed.
+    """
+    return profile_dataframe(_df, name=name, sample_size=sample_size)
+
+
+## ------------------------- RENDERING ------------------------- ##
+def render_json(profile, indent=2):
+    """Render a profile as a JSON string."""
+    return json.dumps(profile, indent=indent, default=str)
+
+def render_html(profile):
+    """Render a profile as an HTML fragment (summary line + one table row per column)."""
+    rows = []
+    for col, info in profile['columns'].items():
+        row = {k: v for k, v in info.items() if k != 'stats'}
+        row.update(info.get('stats', {}))
+        rows.append(pd.Series(row, name=col))
+    table = pd.DataFrame(rows)
+
+    sample_note = f" (sample of {profile['sample_rows']:,} rows)" if profile['sampled'] else ""
+    return (
+        f"<h3>{profile['name']}</h3>"
+        f"<p>{profile['rows']:,} rows x {profile['columns_count']} columns{sample_note}, "
+        f"{profile['memory_bytes'] / 1024 ** 2:.1f} MB</p>"
+        + table.to_html(na_rep="")
+    )
+
+def render_text(profile):
+    """Render a profile as the console report printed by database_insight."""
+    line = "═" * 80
+    out = [f"\n╔{line}╗", f"║ {'DATABASE INSIGHT: ' + profile['name'].upper():^78} ║", f"╚{line}╝\n"]
+
+    # Shape
+    sample_note = f" (profiled on a sample of {profile['sample_rows']} rows)" if profile['sampled'] else ""
+    out.append(f"📊 Shape: {profile['rows']} rows x {profile['columns_count']} columns{sample_note}\n")
+
+    # Data types, cardinality and memory
+    out.append("📝 Columns (dtype, ~distinct values, memory):")
+    for col, info in profile['columns'].items():
+        out.append(f"  - {col}: {info['dtype']}, ~{info['cardinality']} distinct, {info['memory_bytes'] / 1024:.1f} KB")
+
+    # Missing values
+    missing = {col: info['null_count'] for col, info in profile['columns'].items() if info['null_count'] > 0}
+    if missing:
+        out.append("\n⚠️ Missing Values:")
+        out.extend(f"  - {col}: {count}" for col, count in missing.items())
+    else:
+        out.append("\n✅ Missing Values: None")
+
+    # Descriptive stats
+    described = {col: info['stats'] for col, info in profile['columns'].items() if 'stats' in info}
+    out.append("\n📈 Descriptive Statistics:")
+    if described:
+        for col, stats in described.items():
+            out.append(f"  - {col}:")
+            out.append("      " + ", ".join(
+                f"{stat}={value:.2f}" if isinstance(value, float) else f"{stat}={value}"
+                for stat, value in stats.items()
+            ))
+    else:
+        out.append("  No numeric or time columns to describe.")
+
+    return "\n".join(out)
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.profiling [json|html]  (profiles the published snapshot)
+    import sys
+    from .snapshot import load_snapshot
+
+    output = sys.argv[1] if len(sys.argv) > 1 else "json"
+    frames, _ = load_snapshot()
+    if frames is None:
+        sys.exit("No published snapshot found.")
+
+    names = ("Flight Merged DataFrame", "Booking DataFrame", "Airline Merged DataFrame")
+    profiles = [profile_dataframe(df, name=name) for df, name in zip(frames, names)]
+    if output == "html":
+        print("\n".join(render_html(profile) for profile in profiles))
+    else:
+        print(render_json(profiles))
@@ -0,0 +1,234 @@
+# rollup.py
+import calendar
+import copy
+import threading
+import numpy as np
+import pandas as pd
+
+# Sentinel period code for rows without a booking_date
+PERIOD_NAT = np.iinfo(np.int64).min
+
+_rollup_lock = threading.Lock()
+_latest_rollup = None  # (generation, TimeRollup)
+
+
+def period_codes(dates, granularity):
+    """
+    Encode dates as integer periods: days since epoch ('D'), year * 12 + month - 1 ('M')
+    or year * 4 + quarter - 1 ('Q'). Missing dates get PERIOD_NAT.
+    """
+    dates = pd.to_datetime(pd.Series(dates), errors='coerce')
+    missing = dates.isna().to_numpy()
+    if granularity == 'D':
+        codes = dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+    else:
+        year = dates.dt.year.fillna(0).to_numpy(dtype=np.int64)
+        month = dates.dt.month.fillna(1).to_numpy(dtype=np.int64)
+        codes = year * 12 + month - 1 if granularity == 'M' else year * 4 + (month - 1) // 3
+    codes[missing] = PERIOD_NAT
+    return codes
+
+
+class TimeRollup:
+    """
+    Booking totals by booking-date period and dashboard filter dimension, at daily,
+    monthly and quarterly granularity.
+
+    Each granularity is a compact table of the distinct (period, dimension codes)
+    combinations with their summed weight (booking_count) and row count. Every booking
+    remembers which combination it belongs to, so later generations are folded in by
+    adding new bookings and applying weight deltas instead of re-aggregating everything.
+    Queries are boolean masks and bincounts over the combination arrays.
+    """
+
+    GRANULARITIES = ('D', 'M', 'Q')
+    DIMENSIONS = ['departure_year', 'departure_month', 'destination_city', 'passenger_age', 'airline_name']
+
+    def __init__(self, weight='booking_count'):
+        self.weight = weight
+        self.values = {dim: pd.Index([], dtype=object) for dim in self.DIMENSIONS}
+        self.ids = pd.Index([])
+        self.row_weight = np.empty(0)
+        self.row_combo = {g: np.empty(0, dtype=np.int64) for g in self.GRANULARITIES}
+        self.combos = {g: None for g in self.GRANULARITIES}
+        self.keys = {g: np.empty((0, len(self.DIMENSIONS) + 1), dtype=np.int64) for g in self.GRANULARITIES}
+        self.totals = {g: np.empty(0) for g in self.GRANULARITIES}
+        self.rows = {g: np.empty(0, dtype=np.int64) for g in self.GRANULARITIES}
+
+    ## ------------------------- MAINTENANCE ------------------------- ##
+    def _dimension_codes(self, df):
+        codes = []
+        for dim in self.DIMENSIONS:
+            column = df[dim].astype(object) if dim in df.columns else pd.Series(np.nan, index=df.index)
+            dim_codes = self.values[dim].get_indexer(column)
+            unseen = (dim_codes == -1) & column.notna().to_numpy()
+            if unseen.any():
+                self.values[dim] = self.values[dim].append(pd.Index(pd.unique(column[unseen]), dtype=object))
+                dim_codes = self.values[dim].get_indexer(column)
+            codes.append(dim_codes)
+        return codes
+
+    def _add_rows(self, df):
+        dim_codes = self._dimension_codes(df)
+        weights = df[self.weight].fillna(0).to_numpy(dtype=float)
+
+        for g in self.GRANULARITIES:
+            keys = pd.MultiIndex.from_arrays([period_codes(df['booking_date'], g)] + dim_codes)
+            combo = self.combos[g].get_indexer(keys) if self.combos[g] is not None else np.full(len(keys), -1)
+
+            new = combo == -1
+            if new.any():
+                new_keys = keys[new].unique()
+                self.combos[g] = new_keys if self.combos[g] is None else self.combos[g].append(new_keys)
+                self.keys[g] = np.vstack([self.keys[g], np.column_stack(
+                    [new_keys.get_level_values(i).to_numpy(dtype=np.int64) for i in range(new_keys.nlevels)]
+                )])
+                self.totals[g] = np.concatenate([self.totals[g], np.zeros(len(new_keys))])
+                self.rows[g] = np.concatenate([self.rows[g], np.zeros(len(new_keys), dtype=np.int64)])
+                combo = self.combos[g].get_indexer(keys)
+
+            np.add.at(self.totals[g], combo, weights)
+            np.add.at(self.rows[g], combo, 1)
+            self.row_combo[g] = np.concatenate([self.row_combo[g], combo])
+
+        self.ids = self.ids.append(df.index)
+        self.row_weight = np.concatenate([self.row_weight, weights])
+
+    def update(self, booking_df):
+        """
+        Bring the rollup in line with booking_df (indexed by booking_id).
+
+        Bookings already in the rollup only contribute a weight delta (booking_count is a
+        per-flight total and moves as bookings are added); new bookings are encoded and
+        appended; bookings that disappeared are subtracted. Dates and dimensions of
+        existing bookings are assumed not to change.
+        """
+        positions = self.ids.get_indexer(booking_df.index)
+        known = positions >= 0
+
+        # Existing bookings: weight deltas
+        new_weight = booking_df[self.weight].fillna(0).to_numpy(dtype=float)
+        target = self.row_weight.copy()
+        target[positions[known]] = new_weight[known]
+
+        # Removed bookings: subtract their weight and row
+        removed = np.ones(len(self.ids), dtype=bool)
+        removed[positions[known]] = False
+        target[removed] = 0
+
+        delta = target - self.row_weight
+        changed = np.flatnonzero(delta)
+        for g in self.GRANULARITIES:
+            np.add.at(self.totals[g], self.row_combo[g][changed], delta[changed])
+            np.add.at(self.rows[g], self.row_combo[g][removed], -1)
+        self.row_weight = target
+
+        if removed.any():
+            keep = ~removed
+            self.ids = self.ids[keep]
+            self.row_weight = self.row_weight[keep]
+            for g in self.GRANULARITIES:
+                self.row_combo[g] = self.row_combo[g][keep]
+
+        # New bookings
+        if (~known).any():
+            self._add_rows(booking_df[~known])
+        return self
+
+    ## ------------------------- QUERIES ------------------------- ##
+    def _mask(self, granularity, filters):
+        # filters: dimension -> selected values (empty/None means no filter)
+        keys = self.keys[granularity]
+        mask = self.rows[granularity] > 0
+        for column, dim in enumerate(self.DIMENSIONS, start=1):
+            selected = (filters or {}).get(dim)
+            if selected is not None and len(selected) > 0:
+                selected_codes = self.values[dim].get_indexer(pd.Index(list(selected), dtype=object))
+                mask &= np.isin(keys[:, column], selected_codes[selected_codes >= 0])
+        return mask
+
+    def period_totals(self, granularity='M', filters=None):
+        """
+        Total weight per period for the filtered bookings.
+
+        Returns:
+            Series indexed by integer period code (see period_codes), in period order.
+        """
+        mask = self._mask(granularity, filters)
+        periods = self.keys[granularity][mask, 0]
+        weights = self.totals[granularity][mask]
+        valid = periods != PERIOD_NAT
+        if not valid.any():
+            return pd.Series(dtype=float)
+
+        periods, weights = periods[valid], weights[valid]
+        start = periods.min()
+        sums = np.bincount(periods - start, weights=weights)
+        index = np.arange(start, start + len(sums))
+        present = np.bincount(periods - start, minlength=len(sums)) > 0
+        return pd.Series(sums[present], index=index[present])
+
+    def growth(self, filters=None):
+        """
+        Bookings of the latest booking month and growth vs the previous month.
+
+        Returns:
+            (current_month_bookings, growth_pct); growth_pct is None when the previous
+            month has no bookings.
+        """
+        monthly = self.period_totals('M', filters)
+        if monthly.empty:
+            return 0, None
+
+        current_month = monthly.index.max()
+        current_month_bookings = monthly.get(current_month, 0)
+        previous_month_bookings = monthly.get(current_month - 1, 0)
+
+        if previous_month_bookings > 0:
+            growth_pct = ((current_month_bookings - previous_month_bookings) / previous_month_bookings) * 100
+        else:
+            growth_pct = None
+        return int(round(current_month_bookings)), growth_pct
+
+    def departure_month_totals(self, filters=None):
+        """Total weight per departure month, as a Series indexed January..December."""
+        month_order = list(calendar.month_name)[1:]
+        mask = self._mask('Q', filters)
+        column = self.DIMENSIONS.index('departure_month') + 1
+        month_codes = self.keys['Q'][mask, column]
+        weights = self.totals['Q'][mask]
+
+        # departure_month code -> position in month_order; the trailing -1 maps missing (-1) codes
+        position = np.array([month_order.index(m) if m in month_order else -1 for m in self.values['departure_month']] + [-1])
+        month_position = position[month_codes]
+
+        valid = month_position >= 0
+        sums = np.bincount(month_position[valid], weights=weights[valid], minlength=12)
+        return pd.Series(sums, index=pd.Index(month_order, name='departure_month'), name=self.weight)
+
+    def quarter_totals(self, filters=None):
+        """Total weight per departure quarter, as {'Q1': ..., 'Q4': ...}."""
+        quarters = self.departure_month_totals(filters).to_numpy().reshape(4, 3).sum(axis=1)
+        return {f"Q{i + 1}": total for i, total in enumerate(quarters)}
+
+
+def rollup_for(booking_df, generation=None):
+    """
+    Return the time rollup for a dataset generation.
+
+    The rollup is built once per generation; a new generation updates the previous
+    rollup incrementally (see TimeRollup.update). Without a generation it is built from scratch.
+    """
+    global _latest_rollup
+    with _rollup_lock:
+        if generation is None:
+            return TimeRollup().update(booking_df)
+
+        if _latest_rollup is not None and _latest_rollup[0] == generation:
+            return _latest_rollup[1]
+
+        rollup = TimeRollup() if _latest_rollup is None else copy.deepcopy(_latest_rollup[1])
+        rollup.update(booking_df)
+
+        _latest_rollup = (generation, rollup)
+        return rollup
@@ -0,0 +1,133 @@
+# snapshot.py
+import os
+import pickle
+import threading
+import time
+import streamlit as st
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "snapshots")
+SNAPSHOT_FILE = "dashboard_frames.pkl"
+
+_refresh_lock = threading.Lock()
+_refresh_thread = None
+_published_in_process = False  # set once this process has published a snapshot
+
+
+def snapshot_path(snapshot_dir=SNAPSHOT_DIR):
+    """Return the path of the published snapshot file."""
+    return os.path.join(snapshot_dir, SNAPSHOT_FILE)
+
+
+def snapshot_generation(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Return an identifier for the currently published snapshot, or None if
+    nothing has been published yet. It changes every time a snapshot is published.
+    """
+    path = snapshot_path(snapshot_dir)
+    if not os.path.exists(path):
+        return None
+    return os.stat(path).st_mtime_ns
+
+
+def publish_snapshot(frames, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Write the final dashboard DataFrames to disk.
+
+    The file is written to a temporary path first and then swapped in, so a
+    reader never sees a half-written snapshot.
+
+    Args:
+        frames: tuple of (flight_merged_df, booking_df, airline_merged_df)
+        snapshot_dir: folder holding the snapshot file.
+
+    Returns:
+        The generation of the published snapshot (see snapshot_generation).
+    """
+    global _published_in_process
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = snapshot_path(snapshot_dir)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(tuple(frames), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # The rename keeps the file's mtime, so this is the generation readers will see
+    generation = os.stat(tmp_path).st_mtime_ns
+    os.replace(tmp_path, path)
+    _published_in_process = True
+    return generation
+
+
+class _StaleSnapshot(Exception):
+    # A newer snapshot was published between reading the generation and opening the file
+    pass
+
+
+@st.cache_data
+def _read_snapshot(path, generation):
+    # generation is part of the cache key: a new snapshot means a new read.
+    # The open file is checked against it, so frames are never cached under another generation
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_mtime_ns != generation:
+            raise _StaleSnapshot()
+        return pickle.load(f)
+
+
+def load_snapshot(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Load the last published snapshot.
+
+    Returns:
+        ((flight_merged_df, booking_df, airline_merged_df), generation), or (None, None)
+        if no snapshot exists. The generation is the one of the file the frames were read from.
+    """
+    while True:
+        generation = snapshot_generation(snapshot_dir)
+        if generation is None:
+            return None, None
+        try:
+            return _read_snapshot(snapshot_path(snapshot_dir), generation), generation
+        except _StaleSnapshot:
+            continue
+
+
+def _refresh(build_fn, snapshot_dir, on_publish):
+    start = time.perf_counter()
+    try:
+        frames = build_fn()
+        generation = publish_snapshot(frames, snapshot_dir)
+    except Exception as e:
+        print(f"Error refreshing dashboard snapshot: {e}")
+        return
+    print(f"✅ Published fresh dashboard snapshot in {time.perf_counter() - start:.1f}s")
+
+    if on_publish is not None:
+        on_publish(frames, generation)
+
+
+def start_background_refresh(build_fn, snapshot_dir=SNAPSHOT_DIR, on_publish=None):
+    """
+    Rebuild the dashboard DataFrames in a background thread and publish them
+    as the new snapshot. Only one refresh is started per process, so Streamlit
+    reruns do not trigger repeated database loads, and none is started when this
+    process already published a snapshot (e.g. built at boot because none existed):
+    republishing the same data would only invalidate every per-generation cache.
+
+    Args:
+        build_fn: callable returning (flight_merged_df, booking_df, airline_merged_df)
+        snapshot_dir: folder holding the snapshot file.
+        on_publish: optional callable(frames, generation) run after the snapshot is published.
+
+    Returns:
+        The refresh thread, or None if no refresh was needed.
+    """
+    global _refresh_thread
+    with _refresh_lock:
+        if _refresh_thread is None and not _published_in_process:
+            _refresh_thread = threading.Thread(
+                target=_refresh,
+                args=(build_fn, snapshot_dir, on_publish),
+                name="snapshot-refresh",
+                daemon=True,
+            )
+            _refresh_thread.start()
+    return _refresh_thread
@@ -0,0 +1,70 @@
+# startup.py
+import os
+import re
+import subprocess
+import sys
+
+# Modules (and their submodules) that must not be imported while the dashboard boots.
+# Streamlit already imports plotly.io itself, so only plotly.express is listed.
+HEAVY_MODULES = ("plotly.express", "statsmodels", "tqdm", "pymysql", "dotenv")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def import_profile(module="main"):
+    """
+    Import a module in a fresh interpreter with `-X importtime` and collect
+    the cumulative import time of every module it pulls in.
+
+    Args:
+        module: module to import, relative to the project root.
+
+    Returns:
+        profile: dictionary of module_name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr[-2000:]}")
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            profile[match.group(3)] = int(match.group(2))
+    return profile
+
+
+def _is_heavy(name, heavy_modules=HEAVY_MODULES):
+    return any(name == heavy or name.startswith(heavy + ".") for heavy in heavy_modules)
+
+
+def eager_heavy_imports(module="main", heavy_modules=HEAVY_MODULES):
+    """
+    Return the heavy modules (see HEAVY_MODULES) that get imported as a
+    side effect of importing `module`. An empty list means the boot path is lazy.
+    """
+    profile = import_profile(module)
+    return sorted(name for name in profile if _is_heavy(name, heavy_modules))
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.startup [module]
+    target = sys.argv[1] if len(sys.argv) > 1 else "main"
+    profile = import_profile(target)
+
+    print(f"\nSlowest imports for '{target}':\n")
+    for name, micros in sorted(profile.items(), key=lambda item: item[1], reverse=True)[:15]:
+        print(f"  {micros / 1000:>9.1f} ms  {name}")
+
+    offenders = sorted(name for name in profile if _is_heavy(name))
+    if offenders:
+        print(f"\n⚠️ Heavy modules imported at boot: {', '.join(offenders)}")
+        sys.exit(1)
+    print("\n✅ No heavy modules imported at boot.")
@@ -0,0 +1,293 @@
+# streaming.py
+# Offline, CLI-only job (python -m src.streaming): the dashboard still needs booking_df
+# in memory, so it does not read these aggregates or the Parquet spill.
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+from .database import load_tables, iter_table_chunks, query_scalar
+from .utils import replace_empty_with_nan
+from .wrangling import clean_tables, wrangle_dimensions, enrich_bookings
+from .inventory import SeatInventory
+from .merge import merge_flight_dimensions
+
+# Same redundant columns merge_dataframes drops from booking_df (flight_id is kept
+# because booking_count is only known per flight once the last chunk is in)
+BOOKING_DROP_COLS = ['iata', 'maker', 'max_altitude', 'actual_departure', 'origin_country']
+
+# One record per booking row while deduplicating: 24 bytes instead of the full row
+HASH_RECORD = np.dtype([('hash', '<u8'), ('row', '<i8'), ('age', '<f8')])
+
+# Hash records per partition, in chunks (a partition of records is still far
+# smaller in memory than one chunk of booking rows)
+PARTITION_CHUNKS = 16
+
+
+## ------------------------- GENERATOR STAGES ------------------------- ##
+def row_hashes(df):
+    """
+    Hash every row of a DataFrame (the index is ignored, like drop_duplicates).
+
+    Numeric columns are hashed as float64, so a row hashes the same whether its
+    column came back as int or float in a given chunk (e.g. a chunk without NULLs).
+    """
+    numeric = df.select_dtypes(include='number').columns
+    return pd.util.hash_pandas_object(df.astype({col: 'float64' for col in numeric}), index=False).to_numpy()
+
+def _staged_path(work_dir, folder, number, ext):
+    return os.path.join(work_dir, folder, f"{number:05d}.{ext}")
+
+def stage_booking_chunks(chunks, work_dir, partitions=1):
+    """
+    First deduplication pass: replace empty strings with NaN and stage every chunk on disk.
+
+    Each chunk is written to work_dir/chunks/, and one hash record per row (row hash,
+    row number in the table, passenger_age) is appended to one of `partitions` files
+    in work_dir/hashes/, chosen by the hash. Copies of a row always share a partition,
+    so partitions can be deduplicated one at a time.
+
+    Returns:
+        chunk_starts: row number of the first row of every staged chunk.
+    """
+    for folder in ('chunks', 'hashes', 'drops'):
+        os.makedirs(os.path.join(work_dir, folder), exist_ok=True)
+
+    chunk_starts, rows = [], 0
+    for number, chunk in enumerate(chunks):
+        chunk = replace_empty_with_nan(chunk)
+        chunk.to_parquet(_staged_path(work_dir, 'chunks', number, 'parquet'))
+
+        records = np.empty(len(chunk), dtype=HASH_RECORD)
+        records['hash'] = row_hashes(chunk)
+        records['row'] = np.arange(rows, rows + len(chunk))
+        records['age'] = pd.to_numeric(chunk['passenger_age'], errors='coerce') if 'passenger_age' in chunk else np.nan
+
+        partition = records['hash'] % np.uint64(partitions)
+        order = np.argsort(partition, kind='stable')
+        keys, starts = np.unique(partition[order], return_index=True)
+        for k, group in zip(keys, np.split(records[order], starts[1:])):
+            with open(_staged_path(work_dir, 'hashes', int(k), 'bin'), 'ab') as f:
+                group.tofile(f)
+
+        chunk_starts.append(rows)
+        rows += len(chunk)
+    return np.array(chunk_starts, dtype=np.int64)
+
+def find_duplicate_rows(work_dir, chunk_starts, partitions=1):
+    """
+    Second deduplication pass, one hash partition in memory at a time.
+
+    Rows are duplicates when their full-row hashes match (the index is ignored, like
+    clean_tables); the first copy in table order is kept. The row numbers to drop are
+    written per chunk to work_dir/drops/.
+
+    Returns:
+        age_fill: mean passenger_age of the rows kept, as wrangle_data computes it
+        after deduplication.
+    """
+    age_sum, age_count = 0.0, 0
+    for k in range(partitions):
+        path = _staged_path(work_dir, 'hashes', k, 'bin')
+        if not os.path.exists(path):
+            continue
+
+        records = np.fromfile(path, dtype=HASH_RECORD)
+        records = records[np.lexsort((records['row'], records['hash']))]
+        duplicate = np.zeros(len(records), dtype=bool)
+        duplicate[1:] = records['hash'][1:] == records['hash'][:-1]
+
+        ages = records['age'][~duplicate]
+        ages = ages[~np.isnan(ages)]
+        age_sum, age_count = age_sum + ages.sum(), age_count + len(ages)
+
+        dropped = records['row'][duplicate]
+        chunk_of = np.searchsorted(chunk_starts, dropped, side='right') - 1
+        for number in np.unique(chunk_of):
+            with open(_staged_path(work_dir, 'drops', int(number), 'bin'), 'ab') as f:
+                dropped[chunk_of == number].tofile(f)
+
+    return age_sum / age_count if age_count else np.nan
+
+def read_staged_chunks(work_dir, chunk_starts):
+    """Last deduplication pass: yield the staged chunks in table order, without their duplicate rows."""
+    for number, start in enumerate(chunk_starts):
+        chunk = pd.read_parquet(_staged_path(work_dir, 'chunks', number, 'parquet'))
+
+        drops = _staged_path(work_dir, 'drops', number, 'bin')
+        if os.path.exists(drops):
+            keep = np.ones(len(chunk), dtype=bool)
+            keep[np.fromfile(drops, dtype=np.int64) - start] = False
+            chunk = chunk[keep]
+
+        if chunk.empty:
+            continue
+        yield chunk
+
+def enrich_booking_chunks(chunks, flight, inventory, age_fill):
+    """Apply the booking wrangling to each chunk, admitting seats into the shared inventory."""
+    for chunk in chunks:
+        yield enrich_bookings(chunk, flight, inventory, age_fill)
+
+def join_booking_chunks(chunks, flight_dims):
+    """Join each chunk with the in-memory flight dimensions (see merge_flight_dimensions)."""
+    for chunk in chunks:
+        chunk = chunk.merge(flight_dims, left_on='flight_id', right_index=True, how='inner')
+        chunk.drop(columns=[c for c in BOOKING_DROP_COLS if c in chunk.columns], inplace=True)
+        yield chunk
+
+
+## ------------------------- SINKS ------------------------- ##
+def _add_counts(total, counts):
+    return counts if total is None else total.add(counts, fill_value=0)
+
+class BookingAggregates:
+    """
+    Dashboard aggregates folded chunk by chunk.
+
+    The dashboard sums booking_count (passengers on the row's flight) over booking rows.
+    booking_count is only final after the last chunk, so rows are counted per
+    (flight_id, dimension) and weighted by booking_count in finalize(). Memory is bounded
+    by flights x dimension values, not by the number of bookings.
+    """
+
+    BOOKING_DIMENSIONS = ['passenger_age', 'ticket_type', 'booking_period']
+    FLIGHT_DIMENSIONS = ['destination_city', 'airline_name', 'departure_month']
+
+    def __init__(self):
+        self.rows = 0
+        self.flight_rows = None
+        self.dimension_rows = {}
+
+    def fold(self, chunk):
+        """Add one joined booking chunk to the running counts."""
+        self.rows += len(chunk)
+        self.flight_rows = _add_counts(self.flight_rows, chunk.groupby('flight_id').size())
+
+        keys = {
+            'passenger_age': chunk.get('passenger_age'),
+            'ticket_type': chunk.get('ticket_type'),
+            'booking_period': chunk['booking_date'].dt.to_period('M') if 'booking_date' in chunk else None,
+        }
+        for dim in self.BOOKING_DIMENSIONS:
+            if keys[dim] is None:
+                continue
+            counts = chunk.groupby([chunk['flight_id'], keys[dim].rename(dim)], observed=True).size()
+            self.dimension_rows[dim] = _add_counts(self.dimension_rows.get(dim), counts)
+
+    def finalize(self, flight_merged_df):
+        """
+        Weight the row counts by booking_count.
+
+        Args:
+            flight_merged_df: flight table with booking_count, indexed by flight_id.
+
+        Returns:
+            dictionary with total_travelers, total_flights and one Series of
+            booking_count per dimension.
+        """
+        booking_count = flight_merged_df['booking_count'].fillna(0)
+        result = {'total_flights': self.rows, 'total_travelers': 0}
+        if self.flight_rows is None:
+            return result
+
+        flight_weight = self.flight_rows * booking_count.reindex(self.flight_rows.index, fill_value=0)
+        result['total_travelers'] = int(flight_weight.sum())
+
+        for dim in self.FLIGHT_DIMENSIONS:
+            if dim in flight_merged_df.columns:
+                labels = flight_merged_df[dim].reindex(flight_weight.index)
+                result[dim] = flight_weight.groupby(labels).sum().rename('booking_count')
+
+        for dim, counts in self.dimension_rows.items():
+            weights = booking_count.reindex(counts.index.get_level_values('flight_id'), fill_value=0)
+            weighted = counts * weights.to_numpy()
+            result[dim] = weighted.groupby(level=dim, observed=True).sum().rename('booking_count')
+
+        return result
+
+def spill_chunk(chunk, out_dir, part):
+    """
+    Write a booking chunk into a Parquet dataset partitioned by booking year and month
+    (hive-style year=YYYY/month=MM folders, readable with pd.read_parquet(out_dir)).
+    """
+    dates = chunk['booking_date']
+    partitions = [dates.dt.year.rename('year'), dates.dt.month.rename('month')]
+    for (year, month), group in chunk.groupby(partitions, dropna=False):
+        year = "unknown" if pd.isna(year) else int(year)
+        month = "unknown" if pd.isna(month) else f"{int(month):02d}"
+        path = os.path.join(out_dir, f"year={year}", f"month={month}")
+        os.makedirs(path, exist_ok=True)
+        group.to_parquet(os.path.join(path, f"part-{part:05d}.parquet"))
+
+
+## ------------------------- PIPELINE ------------------------- ##
+def stream_pipeline(chunk_size=50000, spill_dir=None):
+    """
+    Out-of-core version of load_tables -> wrangle_data -> merge_dataframes, run from
+    the command line. The dashboard does not use its output.
+
+    Dimension tables are loaded in memory; the booking table is streamed chunk by chunk,
+    staged on disk and deduplicated by hash partition (see stage_booking_chunks), then
+    read back in table order through enrich -> join and folded into the dashboard
+    aggregates (and optionally spilled to Parquet). Peak memory is bounded by chunk_size,
+    not by the size of the booking table.
+
+    Args:
+        chunk_size: number of booking rows per chunk.
+        spill_dir: if given, joined booking rows are written to spill_dir/booking/
+            (partitioned by year and month) and the flight table to spill_dir/flight.parquet.
+            The staged chunks are kept there while the pipeline runs (system temp otherwise).
+
+    Returns:
+        flight_merged_df, aggregates (see BookingAggregates.finalize), airline_merged_df
+    """
+    dfs = load_tables(exclude=('booking',))
+    dfs = wrangle_dimensions(clean_tables(dfs))
+
+    inventory = SeatInventory.from_tables(dfs['flight'], dfs['airplane'], dfs['airplane_type'])
+    flight_dims = merge_flight_dimensions(dfs)
+
+    total_rows = int(query_scalar("SELECT COUNT(*) FROM booking;"))
+    partitions = max(1, -(-total_rows // (PARTITION_CHUNKS * chunk_size)))
+    if spill_dir:
+        os.makedirs(spill_dir, exist_ok=True)
+
+    aggregates = BookingAggregates()
+    with tempfile.TemporaryDirectory(dir=spill_dir) as work_dir:
+        # Table order, like load_tables, so the same copy of a duplicate row is kept
+        chunk_starts = stage_booking_chunks(iter_table_chunks('booking', chunk_size=chunk_size), work_dir, partitions)
+        age_fill = find_duplicate_rows(work_dir, chunk_starts, partitions)
+
+        chunks = read_staged_chunks(work_dir, chunk_starts)
+        chunks = enrich_booking_chunks(chunks, dfs['flight'], inventory, age_fill)
+        chunks = join_booking_chunks(chunks, flight_dims)
+
+        for part, chunk in enumerate(chunks):
+            aggregates.fold(chunk)
+            if spill_dir:
+                spill_chunk(chunk, os.path.join(spill_dir, 'booking'), part)
+
+    # Seats sold per flight are final now: load factor and booking counts
+    dfs['flight']['load_factor'] = inventory.load_factor()
+    flight_merged_df = merge_flight_dimensions(dfs)
+    seats_sold = pd.Series(inventory.seats_sold, index=inventory.flight_index)
+    flight_merged_df['booking_count'] = seats_sold.reindex(flight_merged_df.index).to_numpy()
+
+    if spill_dir:
+        flight_merged_df.to_parquet(os.path.join(spill_dir, 'flight.parquet'))
+
+    return flight_merged_df, aggregates.finalize(flight_merged_df), dfs['airline'].copy()
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.streaming [chunk_size] [spill_dir]
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    spill_dir = sys.argv[2] if len(sys.argv) > 2 else None
+
+    flight_merged_df, aggregates, _ = stream_pipeline(chunk_size=chunk_size, spill_dir=spill_dir)
+    print(f"\nTotal Travelers: {aggregates['total_travelers']:,}")
+    print(f"Total Flights: {aggregates['total_flights']:,}")
+    for dim in BookingAggregates.FLIGHT_DIMENSIONS + BookingAggregates.BOOKING_DIMENSIONS:
+        if dim in aggregates:
+            print(f"\nBookings per {dim}:\n{aggregates[dim]}")
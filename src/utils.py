@@ -1,5 +1,11 @@
+import os
 import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from .profiling import DEFAULT_SAMPLE_SIZE, profile_dataframe, profile_generation, render_text
+
+# (name, generation) pairs already printed by database_insight
+_reported_generations = set()
 
 def report_missing(df, name="DataFrame"):
     """Print missing value report for a DataFrame."""
@@ -12,27 +18,68 @@ def report_missing(df, name="DataFrame"):
 
 def replace_empty_with_nan(df):
     """
-    Replace empty strings with NaN for all columns in a DataFrame.
+    Replace empty strings with NaN. Only string (object) columns are scanned;
+    a new DataFrame is returned.
+    """
+    string_cols = df.select_dtypes(include=['object', 'string']).columns
+    return df.assign(**{col: df[col].replace("", np.nan) for col in string_cols})
+
+def deduplicate(df):
     """
-    return df.replace("", np.nan)
+    Drop duplicate rows in one exact pass (same rows as df.drop_duplicates();
+    the index is ignored).
 
-def remove_duplicates(df, exclude_tables=None, table_name=None):
+    Args:
+        df (pd.DataFrame): The DataFrame to deduplicate.
+
+    Returns:
+        (df, removed): the deduplicated DataFrame and the number of rows removed.
     """
-    Remove duplicate rows from a DataFrame. Optionally exclude certain tables.
+    mask = df.duplicated().to_numpy()
+
+    removed = int(mask.sum())
+    if removed > 0:
+        df = df[~mask]
+    return df, removed
+
+def _clean_table(df, skip_dedup):
+    df = replace_empty_with_nan(df)
+    if skip_dedup:
+        return df, 0
+    return deduplicate(df)
+
+def clean_tables_parallel(dfs, exclude_tables=None, max_workers=None):
+    """
+    Replace empty strings with NaN and deduplicate every table, one table per worker.
+
+    Threads are used so the tables do not have to be pickled to the workers. Most of
+    the work is on object (string) columns and holds the GIL, so the gain over a loop
+    is limited to the numeric hashing and comparisons.
+
+    Args:
+        dfs (dict): table_name -> DataFrame.
+        exclude_tables (list): tables that are cleaned but not deduplicated.
+        max_workers (int): size of the worker pool (default: one per table, up to CPU count).
+
+    Returns:
+        (dfs, removed): the cleaned tables and table_name -> number of rows removed.
     """
-    if exclude_tables is None:
-        exclude_tables = []
-    
-    if table_name in exclude_tables:
-        return df
-    
-    duplicates = df.duplicated().sum()
-    if duplicates > 0:
-        print(f"Duplicate rows in table '{table_name}': {duplicates}")
-        df = df.drop_duplicates()
-    return df
-
-def database_insight(df, name: str):
+    exclude_tables = exclude_tables or []
+    if max_workers is None:
+        max_workers = max(1, min(len(dfs), os.cpu_count() or 1))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            table_name: pool.submit(_clean_table, df, table_name in exclude_tables)
+            for table_name, df in dfs.items()
+        }
+
+    removed = {}
+    for table_name, future in futures.items():
+        dfs[table_name], removed[table_name] = future.result()
+    return dfs, removed
+
+def database_insight(df, name: str, sample_size=DEFAULT_SAMPLE_SIZE, generation=None):
     """
     Display a visually appealing, comprehensive summary of a DataFrame,
     including numeric, timedelta, and object columns.
@@ -40,49 +87,27 @@ def database_insight(df, name: str):
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
         name (str): Name of the database/table.
-    """
-    line = "═" * 80
-    print(f"\n╔{line}╗")
-    print(f"║ {'DATABASE INSIGHT: ' + name.upper():^78} ║")
-    print(f"╚{line}╝\n")
+        sample_size (int): Profile a reservoir sample of this many rows for larger frames
+            (None profiles every row).
+        generation: Dataset generation; when given the profile is cached per generation
+            and only printed the first time.
 
-    # Shape
-    print(f"📊 Shape: {df.shape[0]} rows x {df.shape[1]} columns\n")
-
-    # Data types
-    print("📝 Column Data Types:")
-    for col, dtype in df.dtypes.items():
-        print(f"  - {col}: {dtype}")
-
-    # Missing values
-    missing = df.isnull().sum()
-    if missing.any():
-        print("\n⚠️ Missing Values:")
-        for col, count in missing[missing > 0].items():
-            print(f"  - {col}: {count}")
-    else:
-        print("\n✅ Missing Values: None")
-
-    # Numeric descriptive stats
-    numeric_df = df.select_dtypes(include=['int64', 'float64'])
-    print("\n📈 Descriptive Statistics (numeric columns):")
-    if not numeric_df.empty:
-        desc = numeric_df.describe().T
-        for col, row in desc.iterrows():
-            print(f"  - {col}:")
-            print(f"      count={int(row['count'])}, mean={row['mean']:.2f}, std={row['std']:.2f}, min={row['min']}, 25%={row['25%']}, 50%={row['50%']}, 75%={row['75%']}, max={row['max']}")
+    Returns:
+        profile: the structured profile (see src.profiling.profile_dataframe).
+    """
+    if generation is None:
+        profile = profile_dataframe(df, name=name, sample_size=sample_size)
     else:
-        print("  No numeric columns to describe.")
+        profile = profile_generation(df, name, generation, sample_size=sample_size)
+        if (name, generation) in _reported_generations:
+            return profile
+        _reported_generations.add((name, generation))
 
-    # Timedelta descriptive stats
-    timedelta_df = df.select_dtypes(include='timedelta64[ns]')
-    if not timedelta_df.empty:
-        print("\n⏱ Descriptive Statistics (timedelta columns):")
-        for col in timedelta_df.columns:
-            print(f"  - {col}: min={timedelta_df[col].min()}, max={timedelta_df[col].max()}, mean={timedelta_df[col].mean()}")
+    print(render_text(profile))
 
     # Head
     print("\n👀 First 5 rows:")
     print(df.head())
 
     print("\n" + "═" * 80 + "\n")
+    return profile
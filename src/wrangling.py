@@ -1,41 +1,24 @@
 import pandas as pd
 import numpy as np
-from .utils import replace_empty_with_nan, remove_duplicates
+from .utils import clean_tables_parallel
+from .inventory import SeatInventory
 import streamlit as st
 
-@st.cache_data
-def wrangle_data(dfs):
+def clean_tables(dfs):
     """
-    Perform full data wrangling: common cleaning + table-specific transformations.
+    Common cleaning applied to every table (in parallel): empty strings -> NaN and duplicate removal.
     """
+    dfs, removed = clean_tables_parallel(dfs, exclude_tables=['passenger_feedback'])
+    for table_name, rows in removed.items():
+        if rows > 0:
+            print(f"Duplicate rows in table '{table_name}': {rows}")
+    return dfs
 
-    ## ------------------------- COMMON CLEANING ------------------------- ##
-    for table_name, df in dfs.items():
-        df = replace_empty_with_nan(df)
-        df = remove_duplicates(df, exclude_tables=['passenger_feedback'], table_name=table_name)
-        dfs[table_name] = df
-
-    ## ------------------------- TABLE-SPECIFIC WRANGLING ------------------------- ##
-    # ------------------------- Booking ------------------------- #
-    booking = dfs['booking']
-
-    # Fill missing passenger_age with mean
-    if 'passenger_age' in booking.columns:
-        booking['passenger_age'].fillna(booking['passenger_age'].mean(), inplace=True)
-
-    # Drop unnecessary columns
-    for col in ['passenger_email', 'passenger_nationality']:
-        if col in booking.columns:
-            booking.drop(columns=col, inplace=True)
-
-    # Extract booking year and month
-    if 'booking_date' in booking.columns:
-        booking['booking_date'] = pd.to_datetime(booking['booking_date'], errors='coerce')
-        booking['booking_year'] = booking['booking_date'].dt.year
-        booking['booking_month'] = booking['booking_date'].dt.month_name()
-
-    dfs['booking'] = booking
-
+def wrangle_dimensions(dfs):
+    """
+    Table-specific wrangling of the small dimension tables
+    (airplane_type, airline, flight). The booking table is handled by enrich_bookings.
+    """
     # ------------------------- Airplane Type ------------------------- #
     airplane_type = dfs['airplane_type']
 
@@ -83,90 +66,98 @@ def wrangle_data(dfs):
 
     dfs['flight'] = flight
 
+    return dfs
+
+def enrich_bookings(booking, flight, inventory, age_fill):
+    """
+    Booking-specific wrangling. Works on the whole booking table or on one chunk of it.
+
+    Args:
+        booking: booking rows (indexed by booking_id).
+        flight: wrangled flight table (indexed by flight_id).
+        inventory: SeatInventory the bookings are admitted into.
+        age_fill: value used for missing passenger_age (mean age of the whole table).
+
+    Returns:
+        booking: enriched booking rows.
+    """
+    # Fill missing passenger_age with mean
+    if 'passenger_age' in booking.columns:
+        booking['passenger_age'] = booking['passenger_age'].fillna(age_fill)
+
+    # Drop unnecessary columns
+    for col in ['passenger_email', 'passenger_nationality']:
+        if col in booking.columns:
+            booking.drop(columns=col, inplace=True)
+
+    # Extract booking year and month
+    if 'booking_date' in booking.columns:
+        booking['booking_date'] = pd.to_datetime(booking['booking_date'], errors='coerce')
+        booking['booking_year'] = booking['booking_date'].dt.year
+        booking['booking_month'] = booking['booking_date'].dt.month_name()
+
     # ------------------------- Booking - Age Groups ------------------------- #
     try:
         bins = [13, 19, 30, 65, 105]
         labels = ['Teen', 'Young Adult', 'Adult', 'Senior']
-        if 'passenger_age' in dfs['booking'].columns:
-            dfs['booking']['passenger_age'] = pd.cut(dfs['booking']['passenger_age'], bins=bins, labels=labels)
+        if 'passenger_age' in booking.columns:
+            booking['passenger_age'] = pd.cut(booking['passenger_age'], bins=bins, labels=labels)
     except Exception as e:
         print(f"Error categorizing age groups in 'booking' table: {e}'")
 
-    # ------------------------- Flight - Load Factor ------------------------- #
-    try:
-        if 'flight' in dfs:
-            dfs['flight']['load_factor'] = np.random.uniform(0.6, 0.95, size=len(dfs['flight']))
-    except Exception as e:
-        print(f"Error computing load factor in 'flight' table: {e}")
-
     # ------------------------- Booking - Passengers & Agent ------------------------- #
-    booking = dfs['booking']
-    flight = dfs['flight']
-    airplane = dfs['airplane']
-    airplane_type = dfs['airplane_type']
-
-    # --- Add columns if not exist ---
-    if 'num_passengers' not in booking.columns:
-        booking['num_passengers'] = 1
-    if 'is_agent' not in booking.columns:
-        booking['is_agent'] = False
-
-    # --- Prepare airplane + airplane_type ---
-    # airplane_id is index in airplane
-    airplane = airplane.copy()
-    airplane['airplane_id'] = airplane.index  # make it a column
-    # airplane_type index is type_id
-    airplane_type = airplane_type.copy()
-    airplane_type['type_id'] = airplane_type.index
-
-    # --- Merge flight -> airplane -> airplane_type to get seats_capacity ---
-    flight_merged = flight.copy()
-    flight_merged = flight_merged.merge(
-        airplane['type_id'],
-        left_on='airplane_id',
-        right_index=True,
-        how='left'
-    )
-    flight_merged = flight_merged.merge(
-        airplane_type['capacity'],
-        left_on='type_id',
-        right_index=True,
-        how='left'
-    )
-
     # --- Merge booking with flight info ---
     booking = booking.merge(
-        flight_merged[['dest_airport_id','capacity','actual_departure']],
+        flight[['dest_airport_id','actual_departure']],
         left_on='flight_id',
         right_index=True,
         how='left'
     )
 
+    domestic = (booking['dest_airport_id'] > 5).to_numpy()
+    covid = booking['actual_departure'].dt.year.isin([2020, 2021]).to_numpy()
+
     # --- Assign num_passengers based on domestic/international & COVID restriction ---
-    for idx, row in booking.iterrows():
-        if pd.notna(row['actual_departure']) and row['actual_departure'].year in [2020, 2021]:
-            booking.at[idx,'num_passengers'] = 1  # COVID: only single traveler
-        elif row['dest_airport_id'] > 5:  # Domestic
-            booking.at[idx,'num_passengers'] = int(np.floor(1 + np.random.rand() * 4))
-        else:  # International
-            booking.at[idx,'num_passengers'] = int(np.floor(1 + np.random.rand() * 6))
+    # COVID: only single traveler, Domestic: 1-4, International: 1-6
+    max_party = np.where(domestic, 4, 6)
+    booking['num_passengers'] = np.where(
+        covid, 1, np.floor(1 + np.random.rand(len(booking)) * max_party)
+    ).astype(int)
 
     # --- Assign is_agent based on domestic/international ---
-    for idx, row in booking.iterrows():
-        if row['dest_airport_id'] > 5:  # Domestic
-            booking.at[idx,'is_agent'] = np.random.rand() < 0.4
-        else:  # International
-            booking.at[idx,'is_agent'] = np.random.rand() < 0.7
+    booking['is_agent'] = np.random.rand(len(booking)) < np.where(domestic, 0.4, 0.7)
 
     # --- Ensure bookings do not exceed seat capacity ---
-    booking['cumulative_passengers'] = booking.groupby('flight_id')['num_passengers'].cumsum()
-    booking.loc[booking['cumulative_passengers'] > booking['capacity'], 'num_passengers'] = 0
+    booking['num_passengers'] = inventory.admit_batch(booking['flight_id'], booking['num_passengers'])
 
     # --- Drop helper columns ---
-    booking.drop(columns=['dest_airport_id','actual_departure','capacity','cumulative_passengers'], inplace=True)
+    booking.drop(columns=['dest_airport_id','actual_departure'], inplace=True)
+
+    booking['is_agent'] = booking['is_agent'].astype(bool)
+
+    return booking
 
-    dfs['booking'] = booking
+@st.cache_data
+def wrangle_data(dfs):
+    """
+    Perform full data wrangling: common cleaning + table-specific transformations.
+    """
 
-    dfs['booking']['is_agent'] = dfs['booking']['is_agent'].astype(bool)
+    ## ------------------------- COMMON CLEANING ------------------------- ##
+    dfs = clean_tables(dfs)
+
+    ## ------------------------- TABLE-SPECIFIC WRANGLING ------------------------- ##
+    dfs = wrangle_dimensions(dfs)
+
+    # ------------------------- Booking ------------------------- #
+    # flight -> airplane -> airplane_type gives the capacity of every flight
+    inventory = SeatInventory.from_tables(dfs['flight'], dfs['airplane'], dfs['airplane_type'])
+
+    booking = dfs['booking']
+    age_fill = booking['passenger_age'].mean() if 'passenger_age' in booking.columns else np.nan
+    dfs['booking'] = enrich_bookings(booking, dfs['flight'], inventory, age_fill)
+
+    # ------------------------- Flight - Load Factor ------------------------- #
+    dfs['flight']['load_factor'] = inventory.load_factor()
 
-    return dfs
\ No newline at end of file
+    return dfs
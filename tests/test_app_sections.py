@@ -0,0 +1,75 @@
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _dashboard_app(save_dir):
+    # Runs inside AppTest: synthetic bookings through the real dashboard
+    import numpy as np
+    import pandas as pd
+    from app import dashboard
+
+    rng = np.random.default_rng(0)
+    n = 2000
+    departure = pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 900, n), unit='D')
+    ages = ['Teen', 'Young Adult', 'Adult', 'Senior']
+    booking_df = pd.DataFrame({
+        'departure_year': departure.year,
+        'departure_month': departure.month_name(),
+        'destination_city': rng.choice(['Lahore', 'Karachi', 'Dubai'], n),
+        'passenger_age': pd.Categorical(rng.choice(ages, n), categories=ages),
+        'airline_name': rng.choice(['PIA', 'Emirates'], n),
+        'booking_count': rng.integers(1, 50, n).astype(float),
+        'booking_date': departure - pd.to_timedelta(rng.integers(1, 60, n), unit='D'),
+        'ticket_type': rng.choice(['One-way', 'Return'], n),
+        'price': rng.random(n) * 500,
+        'business_lounge': rng.choice(['Y', 'N'], n),
+        'inflight_entertainment': rng.choice(['Y', 'N'], n),
+        'inflight_food': rng.choice(['Y', 'N'], n),
+        'weight_kg': rng.integers(10, 40, n),
+        'seat_class': rng.choice(['Economy', 'Business'], n),
+    })
+    rating = pd.DataFrame({'airline_name': ['PIA', 'Emirates'], 'rating': [4.0, 4.5]})
+    dashboard(booking_df, rating=rating, save_dir=save_dir, generation=1)
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # The dashboard reads config/ relative to the project root
+    monkeypatch.chdir(PROJECT_ROOT)
+    at = AppTest.from_function(_dashboard_app, args=(str(tmp_path),), default_timeout=60).run()
+    assert not at.exception
+    return at
+
+
+def _runs(at):
+    return dict(at.session_state['section_runs'])
+
+
+def test_rerun_without_changes_recomputes_nothing(app):
+    before = _runs(app)
+    app.run()
+    assert _runs(app) == before
+
+
+def test_format_toggle_only_reruns_download(app):
+    before = _runs(app)
+    app.radio[0].set_value("TXT").run()
+    after = _runs(app)
+
+    assert after['download'] == before['download'] + 1
+    assert {k: v for k, v in after.items() if k != 'download'} == \
+           {k: v for k, v in before.items() if k != 'download'}
+
+
+def test_year_filter_leaves_forecast_unchanged(app):
+    before = _runs(app)
+    app.sidebar.multiselect[0].select(2023).run()
+    after = _runs(app)
+
+    assert after['forecast'] == before['forecast']
+    assert after['download'] == before['download']
+    assert after['monthly'] == before['monthly'] + 1
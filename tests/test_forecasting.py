@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from src import forecasting
+from src.forecasting import DemandForecaster, forecaster_for, monthly_series
+
+
+def _bookings(rng, start, days, n):
+    departure = pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days, n), unit='D')
+    ages = ['Teen', 'Young Adult', 'Adult', 'Senior']
+    return pd.DataFrame({
+        'departure_year': departure.year,
+        'departure_month': departure.month_name(),
+        'destination_city': rng.choice(['Lahore', 'Karachi', 'Dubai'], n),
+        'passenger_age': pd.Categorical(rng.choice(ages, n), categories=ages),
+        'airline_name': rng.choice(['PIA', 'Emirates'], n),
+        'booking_count': rng.integers(1, 50, n).astype(float),
+    })
+
+
+def test_incremental_update_matches_full_fit(monkeypatch):
+    monkeypatch.setattr(forecasting, '_latest_forecaster', None)
+    rng = np.random.default_rng(0)
+
+    # Data up to mid-June 2023, then more June bookings (revised last month),
+    # July-September bookings and a series that did not exist before
+    first = _bookings(rng, '2022-01-01', 530, 3000)
+    later = pd.concat([first, _bookings(rng, '2023-06-10', 100, 800)])
+    new_series = _bookings(rng, '2023-07-01', 60, 50).assign(destination_city='Jeddah')
+    later = pd.concat([later, new_series], ignore_index=True)
+
+    forecaster_for(first, generation=1)
+    updated = forecaster_for(later, generation=2)
+    full = DemandForecaster().fit(monthly_series(later))
+
+    pd.testing.assert_frame_equal(updated.history, full.history.reindex(updated.history.index), check_names=False)
+    pd.testing.assert_series_equal(updated.forecast(12), full.forecast(12), rtol=1e-6)
+    pd.testing.assert_series_equal(
+        updated.forecast(12, destinations=['Jeddah'], ages=['Adult']),
+        full.forecast(12, destinations=['Jeddah'], ages=['Adult']),
+        rtol=1e-6,
+    )
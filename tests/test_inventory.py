@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from src.inventory import SeatInventory
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_admit_batch_matches_admit(seed):
+    rng = np.random.default_rng(seed)
+    flights = int(rng.integers(1, 8))
+    flight_ids = np.arange(flights) * 10
+    capacity = rng.integers(0, 30, flights).astype(float)
+    capacity[rng.random(flights) < 0.1] = np.nan  # unknown capacity -> unlimited
+
+    batch, single = SeatInventory(flight_ids, capacity), SeatInventory(flight_ids, capacity)
+
+    for _ in range(3):  # several batches, so seats sold carry over between them
+        size = int(rng.integers(0, 40))
+        booked = rng.choice(np.arange(flights + 2) * 10, size)  # includes unknown flights
+        num_passengers = rng.integers(1, 7, size)
+
+        granted = batch.admit_batch(booked, num_passengers)
+        expected = [single.admit(f, n) for f, n in zip(booked, num_passengers)]
+
+        np.testing.assert_array_equal(granted, expected)
+        np.testing.assert_array_equal(batch.seats_sold, single.seats_sold)
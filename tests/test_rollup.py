@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import rollup
+from src.rollup import TimeRollup, rollup_for
+
+AGES = ['Teen', 'Young Adult', 'Adult', 'Senior']
+
+
+def _bookings(rng, ids):
+    n = len(ids)
+    departure = pd.Timestamp('2022-01-01') + pd.to_timedelta(rng.integers(0, 700, n), unit='D')
+    booking_date = departure - pd.to_timedelta(rng.integers(1, 90, n), unit='D')
+    booking_date = booking_date.where(rng.random(n) > 0.02)  # a few bookings without a date
+    return pd.DataFrame({
+        'booking_date': booking_date,
+        'departure_year': departure.year,
+        'departure_month': departure.month_name(),
+        'destination_city': rng.choice(['Lahore', 'Karachi', 'Dubai', 'Jeddah'], n),
+        'passenger_age': pd.Categorical(rng.choice(AGES, n), categories=AGES),
+        'airline_name': rng.choice(['PIA', 'Emirates', 'Airblue'], n),
+        'booking_count': rng.integers(1, 50, n).astype(float),
+    }, index=pd.Index(ids, name='booking_id'))
+
+
+def _random_filters(rng, df):
+    filters = {}
+    for dim in TimeRollup.DIMENSIONS:
+        values = pd.unique(df[dim].astype(object))
+        if rng.random() < 0.5:
+            filters[dim] = list(rng.choice(values, int(rng.integers(1, len(values) + 1)), replace=False))
+    return filters
+
+
+@pytest.fixture
+def generations(monkeypatch):
+    monkeypatch.setattr(rollup, '_latest_rollup', None)
+    rng = np.random.default_rng(0)
+
+    df1 = _bookings(rng, np.arange(3000))
+
+    # Generation 2: some bookings removed, booking_count changed on others, new bookings added
+    kept = df1.drop(index=rng.choice(df1.index, 300, replace=False))
+    changed = rng.choice(kept.index, 500, replace=False)
+    kept.loc[changed, 'booking_count'] += rng.integers(1, 10, len(changed))
+    df2 = pd.concat([kept, _bookings(rng, np.arange(3000, 3800))])
+
+    return rng, df1, df2
+
+
+def test_incremental_update_matches_fresh_rollup(generations):
+    rng, df1, df2 = generations
+
+    rollup_for(df1, 'gen1')
+    updated = rollup_for(df2, 'gen2')
+    fresh = TimeRollup().update(df2)
+
+    for _ in range(200):
+        filters = _random_filters(rng, df2)
+        for granularity in TimeRollup.GRANULARITIES:
+            pd.testing.assert_series_equal(
+                updated.period_totals(granularity, filters), fresh.period_totals(granularity, filters)
+            )
+        assert updated.growth(filters) == pytest.approx(fresh.growth(filters))
+        pd.testing.assert_series_equal(updated.departure_month_totals(filters), fresh.departure_month_totals(filters))
+        assert updated.quarter_totals(filters) == pytest.approx(fresh.quarter_totals(filters))
+
+
+def test_previous_generation_is_not_modified(generations):
+    _, df1, df2 = generations
+
+    first = rollup_for(df1, 'gen1')
+    before = first.period_totals('M').copy()
+    rollup_for(df2, 'gen2')
+
+    pd.testing.assert_series_equal(first.period_totals('M'), before)
+    pd.testing.assert_series_equal(before, TimeRollup().update(df1).period_totals('M'))
@@ -0,0 +1,6 @@
+from src.startup import eager_heavy_imports
+
+
+def test_boot_does_not_import_heavy_modules():
+    # Importing the Streamlit entry point must not pull in plotly.express, tqdm, pymysql, ...
+    assert eager_heavy_imports("main") == []